@@ -0,0 +1,121 @@
+"""initial schema
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-18 09:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_initial_schema'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('company_name', sa.String(length=255), nullable=False),
+        sa.Column('job_title', sa.String(length=255), nullable=False),
+        sa.Column('job_url', sa.Text(), nullable=True),
+        sa.Column('job_description', sa.Text(), nullable=True),
+        sa.Column('location', sa.String(length=255), nullable=True),
+        sa.Column('work_type', sa.String(length=50), nullable=True),
+        sa.Column('salary_min', sa.Numeric(12, 2), nullable=True),
+        sa.Column('salary_max', sa.Numeric(12, 2), nullable=True),
+        sa.Column('salary_currency', sa.String(length=10), nullable=True),
+        sa.Column('source', sa.String(length=100), nullable=True),
+        sa.Column('contact_person', sa.String(length=255), nullable=True),
+        sa.Column('contact_email', sa.String(length=255), nullable=True),
+        sa.Column('contact_phone', sa.String(length=20), nullable=True),
+        sa.Column('current_status', sa.String(length=50), nullable=False),
+        sa.Column('applied_date', sa.Date(), nullable=False),
+        sa.Column('deadline', sa.Date(), nullable=True),
+        sa.Column('is_favorite', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_jobs_id', 'jobs', ['id'])
+    op.create_index('ix_jobs_company_name', 'jobs', ['company_name'])
+    op.create_index('ix_jobs_source', 'jobs', ['source'])
+    op.create_index('ix_jobs_current_status', 'jobs', ['current_status'])
+    op.create_index('ix_jobs_applied_date', 'jobs', ['applied_date'])
+
+    op.create_table(
+        'applications',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('job_id', sa.Integer(), sa.ForeignKey('jobs.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('status_date', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_applications_id', 'applications', ['id'])
+    op.create_index('ix_applications_job_id', 'applications', ['job_id'])
+    op.create_index('ix_applications_status', 'applications', ['status'])
+    op.create_index('ix_applications_status_date', 'applications', ['status_date'])
+
+    op.create_table(
+        'interviews',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('job_id', sa.Integer(), sa.ForeignKey('jobs.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('round_number', sa.Integer(), nullable=False),
+        sa.Column('interview_type', sa.String(length=50), nullable=True),
+        sa.Column('scheduled_date', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('location', sa.String(length=255), nullable=True),
+        sa.Column('meeting_link', sa.Text(), nullable=True),
+        sa.Column('interviewer_name', sa.String(length=255), nullable=True),
+        sa.Column('interviewer_title', sa.String(length=255), nullable=True),
+        sa.Column('preparation_notes', sa.Text(), nullable=True),
+        sa.Column('feedback', sa.Text(), nullable=True),
+        sa.Column('result', sa.String(length=50), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_interviews_id', 'interviews', ['id'])
+    op.create_index('ix_interviews_job_id', 'interviews', ['job_id'])
+    op.create_index('ix_interviews_scheduled_date', 'interviews', ['scheduled_date'])
+
+    op.create_table(
+        'notes',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('job_id', sa.Integer(), sa.ForeignKey('jobs.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('interview_id', sa.Integer(), sa.ForeignKey('interviews.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('note_type', sa.String(length=50), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=True),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('priority', sa.String(length=20), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_notes_id', 'notes', ['id'])
+    op.create_index('ix_notes_job_id', 'notes', ['job_id'])
+    op.create_index('ix_notes_interview_id', 'notes', ['interview_id'])
+    op.create_index('ix_notes_note_type', 'notes', ['note_type'])
+
+    op.create_table(
+        'email_templates',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('template_name', sa.String(length=255), nullable=False),
+        sa.Column('template_type', sa.String(length=50), nullable=False),
+        sa.Column('subject', sa.String(length=500), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('variables', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_email_templates_id', 'email_templates', ['id'])
+    op.create_index('ix_email_templates_template_name', 'email_templates', ['template_name'], unique=True)
+    op.create_index('ix_email_templates_template_type', 'email_templates', ['template_type'])
+
+
+def downgrade() -> None:
+    op.drop_table('email_templates')
+    op.drop_table('notes')
+    op.drop_table('interviews')
+    op.drop_table('applications')
+    op.drop_table('jobs')
@@ -0,0 +1,48 @@
+"""composite and partial indexes for hot list queries
+
+Revision ID: 0002_hot_query_indexes
+Revises: 0001_initial_schema
+Create Date: 2026-10-18 09:30:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_hot_query_indexes'
+down_revision = '0001_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # JobService.get_jobs: status filter + applied_date ordering
+    op.create_index('ix_jobs_status_applied_date', 'jobs', ['current_status', 'applied_date'])
+    op.drop_index('ix_jobs_current_status', table_name='jobs')
+    # JobService.get_jobs: work_type filter + applied_date ordering
+    op.create_index('ix_jobs_work_type_applied_date', 'jobs', ['work_type', 'applied_date'])
+    # JobService.get_jobs: is_favorite=true filter (partial index)
+    op.create_index(
+        'ix_jobs_favorite_applied_date', 'jobs', ['applied_date'],
+        sqlite_where=sa.text('is_favorite = 1'),
+        postgresql_where=sa.text('is_favorite')
+    )
+
+    # InterviewService.get_interviews_by_job: job_id + round_number ordering
+    op.create_index('ix_interviews_job_round', 'interviews', ['job_id', 'round_number'])
+    op.drop_index('ix_interviews_job_id', table_name='interviews')
+    # InterviewService.get_interviews / get_upcoming_interviews: scheduled_date range + result
+    op.create_index('ix_interviews_scheduled_result', 'interviews', ['scheduled_date', 'result'])
+    op.drop_index('ix_interviews_scheduled_date', table_name='interviews')
+
+
+def downgrade() -> None:
+    op.create_index('ix_interviews_scheduled_date', 'interviews', ['scheduled_date'])
+    op.drop_index('ix_interviews_scheduled_result', table_name='interviews')
+    op.create_index('ix_interviews_job_id', 'interviews', ['job_id'])
+    op.drop_index('ix_interviews_job_round', table_name='interviews')
+
+    op.drop_index('ix_jobs_favorite_applied_date', table_name='jobs')
+    op.drop_index('ix_jobs_work_type_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_current_status', 'jobs', ['current_status'])
+    op.drop_index('ix_jobs_status_applied_date', table_name='jobs')
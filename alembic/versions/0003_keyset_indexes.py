@@ -0,0 +1,44 @@
+"""add id tiebreaker to job list indexes for keyset pagination
+
+Revision ID: 0003_keyset_indexes
+Revises: 0002_hot_query_indexes
+Create Date: 2026-10-18 10:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_keyset_indexes'
+down_revision = '0002_hot_query_indexes'
+branch_labels = None
+depends_on = None
+
+FAVORITE_WHERE = dict(
+    sqlite_where=sa.text('is_favorite = 1'),
+    postgresql_where=sa.text('is_favorite')
+)
+
+
+def upgrade() -> None:
+    # JobService orders by (sort column, id); (applied_date, id) lets the
+    # seek predicate and ORDER BY both run off the index
+    op.drop_index('ix_jobs_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_applied_date', 'jobs', ['applied_date', 'id'])
+    op.drop_index('ix_jobs_status_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_status_applied_date', 'jobs', ['current_status', 'applied_date', 'id'])
+    op.drop_index('ix_jobs_work_type_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_work_type_applied_date', 'jobs', ['work_type', 'applied_date', 'id'])
+    op.drop_index('ix_jobs_favorite_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_favorite_applied_date', 'jobs', ['applied_date', 'id'], **FAVORITE_WHERE)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_favorite_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_favorite_applied_date', 'jobs', ['applied_date'], **FAVORITE_WHERE)
+    op.drop_index('ix_jobs_work_type_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_work_type_applied_date', 'jobs', ['work_type', 'applied_date'])
+    op.drop_index('ix_jobs_status_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_status_applied_date', 'jobs', ['current_status', 'applied_date'])
+    op.drop_index('ix_jobs_applied_date', table_name='jobs')
+    op.create_index('ix_jobs_applied_date', 'jobs', ['applied_date'])
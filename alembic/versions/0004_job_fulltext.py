@@ -0,0 +1,80 @@
+"""full-text index over job company, title, location and description
+
+Revision ID: 0004_job_fulltext
+Revises: 0003_keyset_indexes
+Create Date: 2026-10-18 12:00:00
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_job_fulltext'
+down_revision = '0003_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = 'company_name, job_title, location, job_description'
+NEW_VALUES = 'new.id, new.company_name, new.job_title, new.location, new.job_description'
+OLD_VALUES = 'old.id, old.company_name, old.job_title, old.location, old.job_description'
+
+# bm25 weights in SEARCH_COLUMNS order: company and title matter most
+SQLITE_RANK = 'bm25(10.0, 8.0, 3.0, 1.0)'
+
+POSTGRES_SEARCH_VECTOR = """
+    setweight(to_tsvector('simple', coalesce(company_name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(job_title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(location, '')), 'C') ||
+    setweight(to_tsvector('simple', coalesce(job_description, '')), 'D')
+"""
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        # External-content FTS5 table: stores only the index, rows live in jobs.
+        # remove_diacritics folds Vietnamese accents ("Hà Nội" matches "ha noi")
+        op.execute(f"""
+            CREATE VIRTUAL TABLE jobs_fts USING fts5(
+                {SEARCH_COLUMNS},
+                content='jobs', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        """)
+        op.execute(f"INSERT INTO jobs_fts(jobs_fts, rank) VALUES('rank', '{SQLITE_RANK}')")
+        op.execute(f"""
+            CREATE TRIGGER jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts(rowid, {SEARCH_COLUMNS}) VALUES ({NEW_VALUES});
+            END
+        """)
+        op.execute(f"""
+            CREATE TRIGGER jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, {SEARCH_COLUMNS}) VALUES ('delete', {OLD_VALUES});
+            END
+        """)
+        op.execute(f"""
+            CREATE TRIGGER jobs_fts_au AFTER UPDATE OF {SEARCH_COLUMNS} ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, {SEARCH_COLUMNS}) VALUES ('delete', {OLD_VALUES});
+                INSERT INTO jobs_fts(rowid, {SEARCH_COLUMNS}) VALUES ({NEW_VALUES});
+            END
+        """)
+        # Index rows that existed before this migration
+        op.execute("INSERT INTO jobs_fts(jobs_fts) VALUES('rebuild')")
+    elif dialect == 'postgresql':
+        # Generated column: recomputed by PostgreSQL on every insert/update
+        op.execute(
+            f"ALTER TABLE jobs ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({POSTGRES_SEARCH_VECTOR}) STORED"
+        )
+        op.execute("CREATE INDEX ix_jobs_search_vector ON jobs USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS jobs_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS jobs_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS jobs_fts_ai")
+        op.execute("DROP TABLE IF EXISTS jobs_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_jobs_search_vector")
+        op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS search_vector")
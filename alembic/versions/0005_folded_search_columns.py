@@ -0,0 +1,118 @@
+"""accent-folded search shadow columns with trigram indexes
+
+Revision ID: 0005_folded_search_columns
+Revises: 0004_job_fulltext
+Create Date: 2026-10-18 14:00:00
+"""
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_folded_search_columns'
+down_revision = '0004_job_fulltext'
+branch_labels = None
+depends_on = None
+
+FOLDED_COLUMNS = ('company_name', 'job_title', 'location')
+SHADOW_COLUMNS = ', '.join(f'{name}_folded' for name in FOLDED_COLUMNS)
+NEW_VALUES = 'new.id, ' + ', '.join(f'new.{name}_folded' for name in FOLDED_COLUMNS)
+OLD_VALUES = 'old.id, ' + ', '.join(f'old.{name}_folded' for name in FOLDED_COLUMNS)
+BACKFILL_CHUNK = 1000
+
+
+def fold_text(value):
+    """Frozen copy of backend.utils.text.fold_text used for the backfill"""
+    if value is None:
+        return None
+    value = value.replace('đ', 'd').replace('Đ', 'D')
+    decomposed = unicodedata.normalize('NFKD', value)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return re.sub(r'\s+', ' ', stripped).strip().lower()
+
+
+def upgrade() -> None:
+    for name in FOLDED_COLUMNS:
+        op.add_column('jobs', sa.Column(f'{name}_folded', sa.String(length=255), nullable=True))
+
+    # Backfill existing rows (the app refreshes the columns on every write):
+    # read BACKFILL_CHUNK rows at a time by id, write each chunk with one
+    # executemany UPDATE
+    bind = op.get_bind()
+    jobs = sa.table('jobs', sa.column('id'), *[sa.column(name) for name in FOLDED_COLUMNS],
+                    *[sa.column(f'{name}_folded') for name in FOLDED_COLUMNS])
+    update = (
+        jobs.update()
+        .where(jobs.c.id == sa.bindparam('row_id'))
+        .values({f'{name}_folded': sa.bindparam(f'folded_{name}') for name in FOLDED_COLUMNS})
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(jobs.c.id, *[jobs.c[name] for name in FOLDED_COLUMNS])
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(BACKFILL_CHUNK)
+        ).all()
+        if not rows:
+            break
+        bind.execute(update, [
+            {'row_id': row.id, **{f'folded_{name}': fold_text(row._mapping[name]) for name in FOLDED_COLUMNS}}
+            for row in rows
+        ])
+        last_id = rows[-1].id
+
+    dialect = bind.dialect.name
+    if dialect == 'sqlite':
+        # Trigram FTS5 table over the shadow columns: answers LIKE '%...%'
+        # from the index; kept in sync by triggers like jobs_fts (0004)
+        op.execute(f"""
+            CREATE VIRTUAL TABLE jobs_folded_fts USING fts5(
+                {SHADOW_COLUMNS},
+                content='jobs', content_rowid='id', tokenize='trigram'
+            )
+        """)
+        op.execute(f"""
+            CREATE TRIGGER jobs_folded_fts_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_folded_fts(rowid, {SHADOW_COLUMNS}) VALUES ({NEW_VALUES});
+            END
+        """)
+        op.execute(f"""
+            CREATE TRIGGER jobs_folded_fts_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_folded_fts(jobs_folded_fts, rowid, {SHADOW_COLUMNS}) VALUES ('delete', {OLD_VALUES});
+            END
+        """)
+        op.execute(f"""
+            CREATE TRIGGER jobs_folded_fts_au AFTER UPDATE OF {SHADOW_COLUMNS} ON jobs BEGIN
+                INSERT INTO jobs_folded_fts(jobs_folded_fts, rowid, {SHADOW_COLUMNS}) VALUES ('delete', {OLD_VALUES});
+                INSERT INTO jobs_folded_fts(rowid, {SHADOW_COLUMNS}) VALUES ({NEW_VALUES});
+            END
+        """)
+        op.execute("INSERT INTO jobs_folded_fts(jobs_folded_fts) VALUES('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name in FOLDED_COLUMNS:
+            op.execute(
+                f"CREATE INDEX ix_jobs_{name}_folded_trgm ON jobs "
+                f"USING gin ({name}_folded gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS jobs_folded_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS jobs_folded_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS jobs_folded_fts_ai")
+        op.execute("DROP TABLE IF EXISTS jobs_folded_fts")
+    elif dialect == 'postgresql':
+        for name in FOLDED_COLUMNS:
+            op.execute(f"DROP INDEX IF EXISTS ix_jobs_{name}_folded_trgm")
+
+    # Plain ALTER TABLE (not batch): a batch table rebuild would drop the
+    # jobs_fts triggers from 0004
+    for name in reversed(FOLDED_COLUMNS):
+        op.drop_column('jobs', f'{name}_folded')
@@ -0,0 +1,87 @@
+"""analytics rollup tables
+
+Revision ID: 0006_analytics_rollups
+Revises: 0005_folded_search_columns
+Create Date: 2026-10-18 16:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_analytics_rollups'
+down_revision = '0005_folded_search_columns'
+branch_labels = None
+depends_on = None
+
+MONTH_SQL = {
+    'sqlite': "strftime('%Y-%m', {column})",
+    'postgresql': "to_char({column}, 'YYYY-MM')",
+}
+# Timestamps are bucketed in UTC, like rebuild_rollups and the flush hook
+UTC_SQL = {
+    'postgresql': "({column} AT TIME ZONE 'UTC')",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_status_counts',
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('status')
+    )
+    op.create_table(
+        'job_source_status_counts',
+        sa.Column('source', sa.String(length=100), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('source', 'status')
+    )
+    op.create_table(
+        'job_month_status_counts',
+        sa.Column('month', sa.String(length=7), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('month', 'status')
+    )
+    op.create_table(
+        'interview_month_counts',
+        sa.Column('month', sa.String(length=7), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('month')
+    )
+
+    # Backfill from existing rows (same aggregates as rebuild_rollups)
+    dialect_name = op.get_bind().dialect.name
+    month_sql = MONTH_SQL.get(dialect_name, MONTH_SQL['sqlite'])
+    job_month = month_sql.format(column='applied_date')
+    interview_month = month_sql.format(
+        column=UTC_SQL.get(dialect_name, '{column}').format(column='scheduled_date')
+    )
+    op.execute(
+        "INSERT INTO job_status_counts (status, count) "
+        "SELECT current_status, count(*) FROM jobs GROUP BY current_status"
+    )
+    op.execute(
+        "INSERT INTO job_source_status_counts (source, status, count) "
+        "SELECT source, current_status, count(*) FROM jobs "
+        "WHERE source IS NOT NULL GROUP BY source, current_status"
+    )
+    op.execute(
+        f"INSERT INTO job_month_status_counts (month, status, count) "
+        f"SELECT {job_month}, current_status, count(*) FROM jobs "
+        f"GROUP BY {job_month}, current_status"
+    )
+    op.execute(
+        f"INSERT INTO interview_month_counts (month, count) "
+        f"SELECT {interview_month}, count(*) FROM interviews "
+        f"WHERE scheduled_date IS NOT NULL GROUP BY {interview_month}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('interview_month_counts')
+    op.drop_table('job_month_status_counts')
+    op.drop_table('job_source_status_counts')
+    op.drop_table('job_status_counts')
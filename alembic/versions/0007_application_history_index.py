@@ -0,0 +1,27 @@
+"""index application history per job for response-time windows
+
+Revision ID: 0007_application_history_index
+Revises: 0006_analytics_rollups
+Create Date: 2026-10-18 18:00:00
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0007_application_history_index'
+down_revision = '0006_analytics_rollups'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # PARTITION BY job_id ORDER BY status_date, id reads the history in index
+    # order; status is included so the window query never touches the table
+    op.create_index(
+        'ix_applications_job_history', 'applications',
+        ['job_id', 'status_date', 'id', 'status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_job_history', table_name='applications')
@@ -0,0 +1,30 @@
+"""row version counters on jobs and interviews for ETags
+
+Revision ID: 0008_row_version
+Revises: 0007_application_history_index
+Create Date: 2026-10-18 20:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008_row_version'
+down_revision = '0007_application_history_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # updated_at only has 1 s resolution on SQLite - a counter changes on
+    # every write, so conditional GETs never revalidate a stale body
+    for table in ('jobs', 'interviews'):
+        op.add_column(
+            table,
+            sa.Column('row_version', sa.Integer(), nullable=False, server_default=sa.text('1'))
+        )
+
+
+def downgrade() -> None:
+    for table in ('interviews', 'jobs'):
+        op.drop_column(table, 'row_version')
@@ -1,7 +1,7 @@
 """
 API dependencies
 """
-from backend.core.database import get_db
+from backend.core.database import get_db, get_read_db
 
 # Export commonly used dependencies
-__all__ = ["get_db"]
+__all__ = ["get_db", "get_read_db"]
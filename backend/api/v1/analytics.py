@@ -1,17 +1,43 @@
 """
 Analytics API endpoints
 """
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from backend.api.deps import get_db
-from backend.services.analytics_service import AnalyticsService
-from backend.schemas.analytics import AnalyticsResponse
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.api.deps import get_read_db
+from backend.core.conditional import PROCESS_TOKEN, check_not_modified, make_etag
+from backend.services.analytics_service import AnalyticsService, analytics_cache
+from backend.services.salary_service import SalaryService
+from backend.services.stage_time_service import StageTimeService
+from backend.schemas.analytics import (
+    AnalyticsResponse,
+    CohortResponse,
+    FunnelResponse,
+    SalaryAnalyticsResponse,
+    TimeInStageResponse
+)
 
-router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+def analytics_not_modified(request: Request, response: Response):
+    """
+    Conditional GET for every analytics endpoint: results only change with the
+    analytics cache validator, so a matching If-None-Match is answered with
+    304 before anything is queried or computed
+    With the cache turned off (TTL 0) responses carry no ETag
+    """
+    validator = analytics_cache.validator()
+    if validator is None:
+        return
+    etag = make_etag("analytics", PROCESS_TOKEN, request.url.path, str(request.query_params), validator)
+    response.headers.update(check_not_modified(request, etag))
+
+
+router = APIRouter(prefix="/analytics", tags=["analytics"], dependencies=[Depends(analytics_not_modified)])
 
 
 @router.get("/", response_model=AnalyticsResponse)
-def get_analytics(db: Session = Depends(get_db)):
+async def get_analytics(db: AsyncSession = Depends(get_read_db)):
     """
     Get complete analytics report including:
     - Summary statistics
@@ -19,35 +45,89 @@ def get_analytics(db: Session = Depends(get_db)):
     - Statistics by source
     - Timeline data
     """
-    analytics = AnalyticsService.get_complete_analytics(db)
+    analytics = await AnalyticsService.get_complete_analytics(db)
     return analytics
 
 
 @router.get("/summary")
-def get_summary(db: Session = Depends(get_db)):
+async def get_summary(db: AsyncSession = Depends(get_read_db)):
     """Get summary statistics only"""
-    return AnalyticsService.get_summary_statistics(db)
+    return await AnalyticsService.get_summary_statistics(db)
 
 
 @router.get("/by-status")
-def get_by_status(db: Session = Depends(get_db)):
+async def get_by_status(db: AsyncSession = Depends(get_read_db)):
     """Get statistics grouped by status"""
-    return AnalyticsService.get_statistics_by_status(db)
+    return await AnalyticsService.get_statistics_by_status(db)
 
 
 @router.get("/by-source")
-def get_by_source(db: Session = Depends(get_db)):
+async def get_by_source(db: AsyncSession = Depends(get_read_db)):
     """Get statistics grouped by source"""
-    return AnalyticsService.get_statistics_by_source(db)
+    return await AnalyticsService.get_statistics_by_source(db)
+
+
+@router.get("/funnel", response_model=FunnelResponse)
+async def get_funnel(db: AsyncSession = Depends(get_read_db)):
+    """
+    Get the pipeline funnel from the status history:
+    - Jobs reaching each stage (cumulative, rejections included)
+    - From -> to transition counts (Sankey links)
+    """
+    return await AnalyticsService.get_funnel(db)
+
+
+@router.get("/cohorts", response_model=CohortResponse)
+async def get_cohorts(
+    start_date: Optional[date] = Query(None, description="Earliest applied_date to include"),
+    end_date: Optional[date] = Query(None, description="Latest applied_date to include"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get the cohort x stage matrix: jobs grouped by application month, with
+    the share that reached Screening/Interview/Offer/Hired and how fast
+    """
+    return await AnalyticsService.get_cohorts(db, start_date, end_date)
+
+
+@router.get("/salary", response_model=SalaryAnalyticsResponse)
+async def get_salary(
+    currency: Optional[str] = Query(None, description="Target currency (default SALARY_BASE_CURRENCY)"),
+    bins: int = Query(10, ge=1, le=50, description="Histogram bins"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get salary analytics normalized to one currency via the configured FX table:
+    histogram, percentiles and medians overall and by source, location, work type
+    """
+    try:
+        return await SalaryService.get_salary_statistics(db, currency, bins)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/time-in-stage", response_model=TimeInStageResponse)
+async def get_time_in_stage(db: AsyncSession = Depends(get_read_db)):
+    """
+    Get time spent in each status before moving on (p50/p75/p90 days),
+    overall and per source
+    """
+    return await StageTimeService.get_time_in_stage(db)
 
 
 @router.get("/timeline")
-def get_timeline(
-    period: str = "month",
-    db: Session = Depends(get_db)
+async def get_timeline(
+    period: str = Query("month", pattern="^(day|week|month|quarter)$"),
+    start_date: Optional[date] = Query(None, description="First day of the range (default: recent buckets)"),
+    end_date: Optional[date] = Query(None, description="Last day of the range (default: today)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get timeline statistics
-    period: 'week', 'month', 'quarter'
+    period: 'day', 'week', 'month', 'quarter' - every bucket in the range is
+    returned, empty ones with zero counts
     """
-    return AnalyticsService.get_timeline_statistics(db, period)
+    try:
+        return await AnalyticsService.get_timeline_statistics(db, period, start_date, end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
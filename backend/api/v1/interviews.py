@@ -1,13 +1,15 @@
 """
 Interviews API Router - CRUD endpoints for interview management
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import datetime
 
-from backend.api.deps import get_db
+from backend.api.deps import get_db, get_read_db
+from backend.core.conditional import check_not_modified, make_etag
 from backend.services.interview_service import InterviewService
+from backend.utils.serialization import FastJSONResponse, compile_serializer, parse_fields
 from backend.schemas.interview import (
     InterviewCreate,
     InterviewUpdate,
@@ -18,11 +20,14 @@ from backend.schemas.interview import (
 
 router = APIRouter(prefix="/interviews", tags=["interviews"])
 
+# List responses skip per-row model validation (see backend/utils/serialization.py)
+serialize_interviews = compile_serializer(InterviewResponse)
+
 
 @router.post("/", response_model=InterviewResponse, status_code=201)
-def create_interview(
+async def create_interview(
     interview_data: InterviewCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new interview
@@ -38,7 +43,7 @@ def create_interview(
     - **preparation_notes**: Notes for interview preparation
     """
     try:
-        interview = InterviewService.create_interview(db, interview_data)
+        interview = await InterviewService.create_interview(db, interview_data)
         return interview
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -47,75 +52,75 @@ def create_interview(
 
 
 @router.get("/", response_model=InterviewListResponse)
-def get_interviews(
+async def get_interviews(
     job_id: Optional[int] = Query(None, description="Filter by job ID"),
     interview_type: Optional[str] = Query(None, description="Filter by interview type"),
     result: Optional[str] = Query(None, description="Filter by result (Passed, Failed, Pending)"),
     scheduled_date_from: Optional[datetime] = Query(None, description="Filter from date"),
     scheduled_date_to: Optional[datetime] = Query(None, description="Filter to date"),
-    db: Session = Depends(get_db)
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return (id is always included)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all interviews with optional filtering
     
-    Returns list of interviews with total count
+    Returns list of interviews with total count; with `fields` only those
+    columns are selected and returned
     """
+    try:
+        selected_fields = parse_fields(fields, InterviewResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     filters = InterviewFilter(
         job_id=job_id,
         interview_type=interview_type,
         result=result,
         scheduled_date_from=scheduled_date_from,
-        scheduled_date_to=scheduled_date_to
+        scheduled_date_to=scheduled_date_to,
+        fields=selected_fields
     )
     
-    interviews, total = InterviewService.get_interviews(db, filters)
+    interviews, total = await InterviewService.get_interviews(db, filters)
+    serialize = compile_serializer(InterviewResponse, selected_fields)
     
-    return InterviewListResponse(
-        items=interviews,
-        total=total
-    )
+    return FastJSONResponse({"items": serialize(interviews), "total": total})
 
 
 @router.get("/upcoming", response_model=InterviewListResponse)
-def get_upcoming_interviews(
+async def get_upcoming_interviews(
     days: int = Query(7, description="Number of days to look ahead", ge=1, le=30),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get upcoming interviews within specified days
     
     - **days**: Number of days to look ahead (default: 7, max: 30)
     """
-    interviews = InterviewService.get_upcoming_interviews(db, days)
+    interviews = await InterviewService.get_upcoming_interviews(db, days)
     
-    return InterviewListResponse(
-        items=interviews,
-        total=len(interviews)
-    )
+    return FastJSONResponse({"items": serialize_interviews(interviews), "total": len(interviews)})
 
 
 @router.get("/job/{job_id}", response_model=InterviewListResponse)
-def get_interviews_by_job(
+async def get_interviews_by_job(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all interviews for a specific job
     
     Returns interviews ordered by round number
     """
-    interviews = InterviewService.get_interviews_by_job(db, job_id)
+    interviews = await InterviewService.get_interviews_by_job(db, job_id)
     
-    return InterviewListResponse(
-        items=interviews,
-        total=len(interviews)
-    )
+    return FastJSONResponse({"items": serialize_interviews(interviews), "total": len(interviews)})
 
 
 @router.get("/stats")
-def get_interview_stats(
+async def get_interview_stats(
     job_id: Optional[int] = Query(None, description="Get stats for specific job"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get interview statistics
@@ -128,18 +133,30 @@ def get_interview_stats(
     - pass_rate: Pass rate percentage
     - by_type: Count by interview type
     """
-    return InterviewService.get_interview_stats(db, job_id)
+    return await InterviewService.get_interview_stats(db, job_id)
 
 
 @router.get("/{interview_id}", response_model=InterviewResponse)
-def get_interview(
+async def get_interview(
     interview_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get interview by ID
+    
+    Returns 304 when If-None-Match / If-Modified-Since still match, checked
+    against the row version and updated_at before the interview is loaded
     """
-    interview = InterviewService.get_interview_by_id(db, interview_id)
+    modified = await InterviewService.get_interview_modified(db, interview_id)
+    if modified is None:
+        raise HTTPException(status_code=404, detail=f"Interview with id {interview_id} not found")
+    updated_at, row_version = modified
+    etag = make_etag("interview", interview_id, row_version, updated_at)
+    response.headers.update(check_not_modified(request, etag, updated_at))
+    
+    interview = await InterviewService.get_interview_by_id(db, interview_id)
     if not interview:
         raise HTTPException(status_code=404, detail=f"Interview with id {interview_id} not found")
     
@@ -147,17 +164,17 @@ def get_interview(
 
 
 @router.put("/{interview_id}", response_model=InterviewResponse)
-def update_interview(
+async def update_interview(
     interview_id: int,
     interview_data: InterviewUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an interview
     
     All fields are optional - only provided fields will be updated
     """
-    interview = InterviewService.update_interview(db, interview_id, interview_data)
+    interview = await InterviewService.update_interview(db, interview_id, interview_data)
     if not interview:
         raise HTTPException(status_code=404, detail=f"Interview with id {interview_id} not found")
     
@@ -165,11 +182,11 @@ def update_interview(
 
 
 @router.patch("/{interview_id}/result", response_model=InterviewResponse)
-def update_interview_result(
+async def update_interview_result(
     interview_id: int,
     result: str = Query(..., description="Interview result: Passed, Failed, or Pending"),
     feedback: Optional[str] = Query(None, description="Feedback from the interview"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update interview result and feedback
@@ -183,7 +200,7 @@ def update_interview_result(
             detail="Result must be one of: Passed, Failed, Pending"
         )
     
-    interview = InterviewService.update_interview_result(db, interview_id, result, feedback)
+    interview = await InterviewService.update_interview_result(db, interview_id, result, feedback)
     if not interview:
         raise HTTPException(status_code=404, detail=f"Interview with id {interview_id} not found")
     
@@ -191,16 +208,16 @@ def update_interview_result(
 
 
 @router.delete("/{interview_id}", status_code=204)
-def delete_interview(
+async def delete_interview(
     interview_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete an interview
     
     Returns 204 No Content on success
     """
-    success = InterviewService.delete_interview(db, interview_id)
+    success = await InterviewService.delete_interview(db, interview_id)
     if not success:
         raise HTTPException(status_code=404, detail=f"Interview with id {interview_id} not found")
     
@@ -1,35 +1,102 @@
 """
 Job API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from backend.api.deps import get_db
+from backend.api.deps import get_db, get_read_db
+from backend.core.conditional import check_not_modified, is_conditional, make_etag
 from backend.services.job_service import JobService
+from backend.utils.constants import CountMode
+from backend.utils.serialization import FastJSONResponse, compile_serializer, parse_fields
 from backend.schemas.job import (
     JobCreate,
     JobUpdate,
     JobResponse,
     JobListResponse,
-    JobFilter
+    JobFilter,
+    JobBulkCreate,
+    JobBulkStatusUpdate,
+    JobBulkResponse
 )
 import math
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# List pages skip per-row model validation (see backend/utils/serialization.py)
+serialize_jobs = compile_serializer(JobResponse)
+
 
 @router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
-def create_job(
+async def create_job(
     job_data: JobCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new job application"""
-    job = JobService.create_job(db, job_data)
+    job = await JobService.create_job(db, job_data)
     return job
 
 
+@router.post("/bulk", response_model=JobBulkResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_create_jobs(
+    batch: JobBulkCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many jobs (with their initial application records) in one transaction
+    
+    The whole batch is validated first - any invalid item rejects the
+    request with 422 and nothing is written. Results are in request order.
+    """
+    jobs = await JobService.bulk_create_jobs(db, batch.items)
+    
+    return FastJSONResponse({
+        "total": len(jobs),
+        "succeeded": len(jobs),
+        "failed": 0,
+        "results": [
+            {"index": index, "job_id": item["id"], "status": "created", "job": item}
+            for index, item in enumerate(serialize_jobs(jobs))
+        ]
+    }, status_code=status.HTTP_201_CREATED)
+
+
+@router.patch("/bulk-status", response_model=JobBulkResponse)
+async def bulk_update_job_status(
+    batch: JobBulkStatusUpdate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Move many jobs to new statuses, adding application history records, in
+    one transaction
+    
+    Statuses and duplicate job ids are validated for the whole batch (422).
+    Unknown job ids are reported per item as `not_found`; the rest are applied.
+    """
+    jobs = await JobService.bulk_update_job_status(db, batch.items)
+    serialized = dict(zip(jobs, serialize_jobs(jobs.values())))
+    
+    results = []
+    for index, item in enumerate(batch.items):
+        job = serialized.get(item.job_id)
+        results.append({
+            "index": index,
+            "job_id": item.job_id,
+            "status": "updated" if job else "not_found",
+            "job": job
+        })
+    
+    return FastJSONResponse({
+        "total": len(results),
+        "succeeded": len(jobs),
+        "failed": len(results) - len(jobs),
+        "results": results
+    })
+
+
 @router.get("/", response_model=JobListResponse)
-def get_jobs(
+async def get_jobs(
+    request: Request,
     company_name: str = None,
     job_title: str = None,
     status: str = None,
@@ -43,16 +110,38 @@ def get_jobs(
     page_size: int = 20,
     sort_by: str = "applied_date",
     sort_order: str = "desc",
-    db: Session = Depends(get_db)
+    cursor: str = None,
+    count: CountMode = CountMode.EXACT,
+    fields: str = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get jobs with filtering, sorting, and pagination
+    
+    - **page**: offset pagination (kept for backward compatibility)
+    - **cursor**: keyset pagination - pass `next_cursor` from the previous
+      response; the page itself costs the same at any depth, but `count=exact`
+      recounts the whole filtered set on every page - pass `count=none` on
+      follow-up pages
+    - **count**: `exact` (default, counted in the page query), `estimate`
+      (planner estimate on PostgreSQL) or `none` (total is null)
+    - **fields**: comma-separated columns to return, e.g.
+      `id,company_name,job_title` - only these are selected (id is always
+      included); omitted means every column
+    
+    Answers `If-None-Match` with 304 after a narrow version of the page
+    query (ids, row versions and the total only), before the full page
     """
     # Convert string dates to date objects if provided
     from datetime import datetime
     date_from = datetime.fromisoformat(applied_date_from).date() if applied_date_from else None
     date_to = datetime.fromisoformat(applied_date_to).date() if applied_date_to else None
     
+    try:
+        selected_fields = parse_fields(fields, JobResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     filters = JobFilter(
         company_name=company_name,
         job_title=job_title,
@@ -66,27 +155,56 @@ def get_jobs(
         page=page,
         page_size=page_size,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        count=count,
+        fields=selected_fields
     )
     
-    jobs, total = JobService.get_jobs(db, filters)
+    try:
+        if is_conditional(request):
+            # Narrow probe of the same page: 304 before the wide columns are read
+            validator = await JobService.get_jobs_validator(db, filters)
+            check_not_modified(request, make_etag("jobs", str(request.query_params), validator))
+        jobs, total, next_cursor = await JobService.get_jobs(db, filters)
+    except ValueError as e:
+        # `status` is shadowed by the query parameter here
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return JobListResponse(
-        items=jobs,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=math.ceil(total / page_size) if total > 0 else 0
-    )
+    # Unconditional requests stay one statement: the ETag comes from the page itself
+    validator = JobService.page_validator(jobs, total, next_cursor)
+    headers = check_not_modified(request, make_etag("jobs", str(request.query_params), validator))
+    
+    # Same shape as JobListResponse, encoded without revalidating the rows
+    return FastJSONResponse({
+        "items": compile_serializer(JobResponse, selected_fields)(jobs),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": None if total is None else math.ceil(total / page_size),
+        "next_cursor": next_cursor
+    }, headers=headers)
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-def get_job(
+async def get_job(
     job_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get job by ID"""
-    job = JobService.get_job_by_id(db, job_id)
+    """Get job by ID (304 on matching If-None-Match / If-Modified-Since)"""
+    modified = await JobService.get_job_modified(db, job_id)
+    if modified is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    updated_at, row_version = modified
+    etag = make_etag("job", job_id, row_version, updated_at)
+    response.headers.update(check_not_modified(request, etag, updated_at))
+    
+    job = await JobService.get_job_by_id(db, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -96,13 +214,13 @@ def get_job(
 
 
 @router.put("/{job_id}", response_model=JobResponse)
-def update_job(
+async def update_job(
     job_id: int,
     job_data: JobUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update job"""
-    job = JobService.update_job(db, job_id, job_data)
+    job = await JobService.update_job(db, job_id, job_data)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -112,14 +230,14 @@ def update_job(
 
 
 @router.patch("/{job_id}/status", response_model=JobResponse)
-def update_job_status(
+async def update_job_status(
     job_id: int,
     new_status: str,
     notes: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update job status and create application history"""
-    job = JobService.update_job_status(db, job_id, new_status, notes)
+    job = await JobService.update_job_status(db, job_id, new_status, notes)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,12 +247,12 @@ def update_job_status(
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_job(
+async def delete_job(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete job"""
-    success = JobService.delete_job(db, job_id)
+    success = await JobService.delete_job(db, job_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -144,11 +262,18 @@ def delete_job(
 
 
 @router.get("/search/{keyword}", response_model=List[JobResponse])
-def search_jobs(
+async def search_jobs(
     keyword: str,
     limit: int = 20,
-    db: Session = Depends(get_db)
+    ranked: bool = True,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Search jobs by keyword"""
-    jobs = JobService.search_jobs(db, keyword, limit)
-    return jobs
+    """
+    Full-text search jobs by keyword
+    
+    - **keyword**: words matched (by prefix, accent-insensitive on SQLite)
+      against company name, job title, location and description
+    - **ranked**: order by relevance (default) or by applied date
+    """
+    jobs = await JobService.search_jobs(db, keyword, limit, ranked)
+    return FastJSONResponse(serialize_jobs(jobs))
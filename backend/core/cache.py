@@ -0,0 +1,115 @@
+"""
+In-process result cache - size-bounded LRU with TTL, keyed by a data version
+"""
+import functools
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class VersionedCache:
+    """
+    LRU + TTL cache whose keys include a global data version
+    bump_version() makes every cached entry unreachable at once (they age out
+    through LRU eviction), so writers never have to know which keys exist
+    fill_context(db) wraps each computation of a missing value, e.g. to read
+    it from the primary rather than a lagging replica
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl: float = 300.0,
+        fill_context: Optional[Callable] = None
+    ):
+        self._lock = threading.Lock()
+        self.fill_context = fill_context or nullcontext
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def bump_version(self):
+        """Invalidate everything cached so far (call after a committed write)"""
+        with self._lock:
+            self.version += 1
+    
+    def get(self, key: Hashable) -> Any:
+        """Cached value for key at the current version, or _MISSING"""
+        with self._lock:
+            entry = self._entries.get((self.version, key))
+            if entry is None or entry[0] < time.monotonic():
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end((self.version, key))
+            self.hits += 1
+            return entry[1]
+    
+    def set(self, key: Hashable, value: Any, version: int):
+        """Store value computed while the data was at `version`"""
+        with self._lock:
+            if version != self.version:
+                # A write committed while the value was being computed
+                return
+            self._entries[(version, key)] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end((version, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def validator(self) -> Optional[tuple]:
+        """
+        Changes whenever a cached value may change: on a version bump and when
+        the TTL window rolls over (entries recomputed after writes elsewhere)
+        None when the TTL is 0 or less (cache off): values are recomputed on
+        every call and there is no version they could be validated against
+        """
+        if self.ttl <= 0:
+            return None
+        return self.version, int(time.time() // self.ttl)
+    
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+    
+    def cached(self, func):
+        """
+        Decorator for async service functions whose first argument is the db
+        session; the remaining arguments form the cache key
+        """
+        @functools.wraps(func)
+        async def wrapper(db, *args, **kwargs):
+            key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+            value = self.get(key)
+            if value is not _MISSING:
+                return value
+            version = self.version
+            with self.fill_context(db):
+                value = await func(db, *args, **kwargs)
+            self.set(key, value, version)
+            return value
+        return wrapper
+    
+    def snapshot(self) -> Dict:
+        """Return the counters as a plain dict"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,213 @@
+"""
+Response compression middleware - negotiated br / zstd / gzip
+Compresses eligible responses (content-type allow-list, minimum size) and
+streams chunk by chunk for streaming responses; brotli and zstd are used only
+when their packages are installed
+"""
+import zlib
+from typing import Dict, Optional, Sequence
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4  # 0-11; higher levels cost far more CPU per response
+ZSTD_LEVEL = 3
+
+
+class _GzipCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+    
+    def flush(self) -> bytes:
+        """Emit everything buffered so far (keeps streamed chunks timely)"""
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+    
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+    
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+    
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encodings() -> Dict[str, type]:
+    """Content-Encoding name -> compressor class, for installed codecs"""
+    encodings = {"gzip": _GzipCompressor}
+    if brotli is not None:
+        encodings["br"] = _BrotliCompressor
+    if zstandard is not None:
+        encodings["zstd"] = _ZstdCompressor
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, preferred: Sequence[str]) -> Optional[str]:
+    """
+    Pick the encoding from `preferred` (server order) with the highest q-value
+    in the Accept-Encoding header; None if the client accepts none of them
+    """
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+    
+    best, best_quality = None, 0.0
+    for name in preferred:
+        quality = weights.get(name, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress responses whose content type is allowed and whose body is at
+    least `minimum_size` bytes; streaming responses are compressed as they go
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: Sequence[str] = ("br", "zstd", "gzip"),
+        content_types: Sequence[str] = ("application/json", "text/")
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        installed = available_encodings()
+        self.compressors = {name: installed[name] for name in encodings if name in installed}
+        self.content_types = tuple(content_types)
+    
+    def is_compressible(self, content_type: str) -> bool:
+        """Content type matches an allow-list entry (entries ending in / are prefixes)"""
+        content_type = content_type.split(";")[0].strip().lower()
+        return any(
+            content_type.startswith(allowed) if allowed.endswith("/") else content_type == allowed
+            for allowed in self.content_types
+        )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.compressors:
+            await self.app(scope, receive, send)
+            return
+        
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, list(self.compressors))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Wraps `send` for one response; decides on the first body message"""
+    
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+    
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.downstream(message)
+            return
+        
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        
+        if self.compressor is not None:
+            data = self.compressor.compress(body)
+            data += self.compressor.flush() if more_body else self.compressor.finish()
+            await self.downstream({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+        
+        # First body message: decide for the whole response
+        start, self.start_message = self.start_message, None
+        headers = MutableHeaders(raw=start["headers"])
+        if (
+            start["status"] in (204, 304)
+            or "content-encoding" in headers
+            or not self.middleware.is_compressible(headers.get("content-type", ""))
+        ):
+            self.passthrough = True
+            await self.downstream(start)
+            await self.downstream(message)
+            return
+        
+        headers.add_vary_header("Accept-Encoding")
+        if not more_body and len(body) < self.middleware.minimum_size:
+            self.passthrough = True
+            await self.downstream(start)
+            await self.downstream(message)
+            return
+        
+        self.compressor = self.middleware.compressors[self.encoding]()
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # Representation bytes differ from the identity body
+            headers["ETag"] = f"W/{etag}"
+        headers["Content-Encoding"] = self.encoding
+        
+        if more_body:
+            del headers["Content-Length"]
+            data = self.compressor.compress(body) + self.compressor.flush()
+        else:
+            data = self.compressor.compress(body) + self.compressor.finish()
+            headers["Content-Length"] = str(len(data))
+        await self.downstream(start)
+        await self.downstream({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -0,0 +1,87 @@
+"""
+Conditional GET - ETag / Last-Modified validators and 304 Not Modified
+Endpoints derive validators from cheap data (ids, row versions, counts) and
+check them before loading or serializing the full response
+"""
+import hashlib
+import uuid
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+from fastapi import HTTPException, Request
+
+# For ETags over per-process state (the analytics cache): its version
+# restarts at 0, so such ETags must never match another process's
+PROCESS_TOKEN = uuid.uuid4().hex
+
+
+def make_etag(*parts) -> str:
+    """
+    Weak ETag over the given validator parts
+    Parts built only from database state match across workers and restarts;
+    add PROCESS_TOKEN to parts that come from in-process state
+    Weak because the same data may be sent with different encodings
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def to_utc(value: datetime) -> datetime:
+    """Timezone-aware UTC datetime; naive values (SQLite) are stored as UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def http_date(value: datetime) -> str:
+    """RFC 7231 HTTP-date (second resolution)"""
+    return format_datetime(to_utc(value).replace(microsecond=0), usegmt=True)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    True when the request's validators still match
+    If-Modified-Since is only considered without If-None-Match (RFC 7232)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return to_utc(last_modified).replace(microsecond=0) <= to_utc(since)
+    return False
+
+
+def is_conditional(request: Request) -> bool:
+    """The request carries a validator (If-None-Match or If-Modified-Since)"""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def check_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> Dict[str, str]:
+    """
+    Raise 304 Not Modified when the request's validators match; otherwise
+    return the validator headers to send with the full response
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    if is_not_modified(request, etag, last_modified):
+        raise HTTPException(status_code=304, headers=headers)
+    return headers
@@ -2,36 +2,167 @@
 Database configuration and session management
 """
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from .config import settings
+from .config import settings, SUPPORTED_DIALECTS
+from .pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from .sqlite import is_sqlite_file_url, apply_sqlite_pragmas
+from .routing import RoutingSession, ReadReplicaRouter, client_last_write
 
-# Create database engine
+# Sync URL prefix -> asyncio driver URL prefix
+ASYNC_DRIVERS = {
+    "sqlite://": "sqlite+aiosqlite://",
+    "postgresql://": "postgresql+asyncpg://",
+    "postgresql+psycopg2://": "postgresql+asyncpg://",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """Map a sync database URL onto the matching asyncio driver"""
+    for sync_prefix, async_prefix in ASYNC_DRIVERS.items():
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+class UnsupportedDatabaseError(RuntimeError):
+    """A configured database URL is not PostgreSQL or SQLite"""
+
+
+def check_supported_database(setting: str, url: str):
+    """
+    Fail at startup, not on the first request that needs dialect-specific
+    SQL (rollup upserts, full-text search, timeline buckets)
+    """
+    backend = make_url(url).get_backend_name()
+    if backend not in SUPPORTED_DIALECTS:
+        raise UnsupportedDatabaseError(
+            f"{setting} uses unsupported database '{backend}'; "
+            f"expected one of: {', '.join(SUPPORTED_DIALECTS)}"
+        )
+
+
+def get_engine_options(url: str, pool_class) -> dict:
+    """
+    Engine keyword arguments for the configured profile
+    In-memory SQLite keeps the dialect's default pool (one shared connection)
+    """
+    options = {"echo": settings.SQL_ECHO}
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options
+    
+    options.update(
+        poolclass=pool_class,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=(
+            settings.DB_POOL_PRE_PING
+            if settings.DB_POOL_PRE_PING is not None
+            else settings.IS_PRODUCTION
+        )
+    )
+    return options
+
+
+check_supported_database("DATABASE_URL", settings.DATABASE_URL)
+if settings.ASYNC_DATABASE_URL:
+    check_supported_database("ASYNC_DATABASE_URL", settings.ASYNC_DATABASE_URL)
+for read_url in settings.DATABASE_READ_URLS:
+    check_supported_database("DATABASE_READ_URLS", read_url)
+
+# Create database engine (used by scripts and schema management)
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=settings.DEBUG
+    **get_engine_options(settings.DATABASE_URL, InstrumentedQueuePool)
 )
 
-# Create session factory
+# Create async database engine (used by the API request path)
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    **get_engine_options(ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool)
+)
+
+# SQLite performance mode: WAL + pragmas, and a read-only pool for GET endpoints
+# so dashboard reads do not queue behind writer connections
+SQLITE_PERFORMANCE_MODE = settings.SQLITE_PERFORMANCE_MODE and is_sqlite_file_url(settings.DATABASE_URL)
+if SQLITE_PERFORMANCE_MODE:
+    apply_sqlite_pragmas(engine)
+    apply_sqlite_pragmas(async_engine.sync_engine)
+
+
+def create_read_engine(url: str):
+    """Create an async engine for read-only traffic"""
+    read_url = get_async_database_url(url)
+    read_engine = create_async_engine(
+        read_url,
+        **get_engine_options(read_url, InstrumentedAsyncQueuePool)
+    )
+    if settings.SQLITE_PERFORMANCE_MODE and is_sqlite_file_url(url):
+        apply_sqlite_pragmas(read_engine.sync_engine, read_only=True)
+    return read_engine
+
+
+# Read replicas for GET endpoints: DATABASE_READ_URLS, or the local
+# read-only SQLite pool when no replicas are configured
+if settings.DATABASE_READ_URLS:
+    read_engines = [create_read_engine(url) for url in settings.DATABASE_READ_URLS]
+elif SQLITE_PERFORMANCE_MODE and settings.SQLITE_READ_POOL:
+    read_engines = [create_read_engine(settings.DATABASE_URL)]
+else:
+    read_engines = []
+
+read_router = ReadReplicaRouter(
+    read_engines,
+    strategy=settings.DATABASE_READ_STRATEGY,
+    # Replicas may lag the primary; a local SQLite read pool never does
+    read_after_write=settings.DATABASE_READ_AFTER_WRITE_SECONDS if settings.DATABASE_READ_URLS else 0.0
+)
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Base class for models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """
-    Dependency to get database session
-    Usage in FastAPI endpoints: db: Session = Depends(get_db)
+    Dependency to get async database session
+    Usage in FastAPI endpoints: db: AsyncSession = Depends(get_db)
+    A committed write keeps this client's follow-up reads on the primary
+    until replicas catch up (see ReadAfterWriteMiddleware)
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
-    """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
+async def get_read_db():
+    """
+    Dependency to get a session for read-only endpoints
+    Usage in FastAPI GET endpoints: db: AsyncSession = Depends(get_read_db)
+    Reads go to a replica chosen by read_router; any write falls back to the primary
+    """
+    replica = read_router.choose(client_last_write())
+    info = {"read_engine": replica.sync_engine} if replica is not None else {}
+    async with AsyncReadSessionLocal(info=info) as db:
+        yield db
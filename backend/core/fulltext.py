@@ -0,0 +1,110 @@
+"""
+Full-text search over jobs - FTS5 on SQLite, tsvector + GIN on PostgreSQL
+Indexed columns: company_name, job_title, location, job_description
+The index is maintained by the database itself (migration 0004: FTS5 sync
+triggers on SQLite, a generated tsvector column on PostgreSQL), so every
+write path - ORM, bulk SQL, seed scripts - keeps it in sync
+
+Substring filters (folded_contains) match the accent-folded *_folded shadow
+columns through a trigram index (migration 0005: FTS5 trigram table on
+SQLite, pg_trgm GIN indexes on PostgreSQL)
+"""
+import re
+from typing import List
+from sqlalchemy import Select, ColumnElement, select, column, table, literal_column, func
+from backend.models.job import Job, FOLDED_COLUMNS
+from backend.utils.text import fold_text
+
+FTS_TABLE = "jobs_fts"
+SEARCH_COLUMNS = ("company_name", "job_title", "location", "job_description")
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_INDEX = "ix_jobs_search_vector"
+FOLDED_FTS_TABLE = "jobs_folded_fts"
+TRIGRAM_INDEX_SUFFIX = "_trgm"
+
+# Letters and digits in any script; everything else separates terms
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+jobs_fts = table(FTS_TABLE, column("rowid"), column("rank"), column(FTS_TABLE))
+jobs_folded_fts = table(
+    FOLDED_FTS_TABLE, column("rowid"), *[column(f"{name}_folded") for name in FOLDED_COLUMNS]
+)
+
+
+def tokenize(keyword: str) -> List[str]:
+    """Split user input into search terms (operators and quotes are dropped)"""
+    return TOKEN_PATTERN.findall(keyword.lower())
+
+
+def folded_pattern(value: str) -> str:
+    """LIKE pattern for an accent-insensitive substring match"""
+    return f"%{fold_text(value)}%"
+
+
+class SQLiteFullText:
+    """FTS5 external-content table jobs_fts, ranked by weighted bm25"""
+    
+    @staticmethod
+    def search_query(terms: List[str], ranked: bool) -> Select:
+        # Every term is a quoted prefix query: "ha"* "noi"* (implicit AND)
+        match = " ".join(f'"{term}"*' for term in terms)
+        query = (
+            select(Job)
+            .select_from(jobs_fts)
+            .join(Job, Job.id == jobs_fts.c.rowid)
+            .where(jobs_fts.c[FTS_TABLE].op("MATCH")(match))
+        )
+        if ranked:
+            # rank uses the bm25 column weights configured in migration 0004
+            return query.order_by(jobs_fts.c.rank)
+        return query.order_by(Job.applied_date.desc(), Job.id.desc())
+    
+    @staticmethod
+    def folded_contains(column_name: str, value: str) -> ColumnElement:
+        # The trigram FTS5 table answers LIKE '%...%' on its columns from the index
+        folded = jobs_folded_fts.c[f"{column_name}_folded"]
+        return Job.id.in_(
+            select(jobs_folded_fts.c.rowid).where(folded.like(folded_pattern(value)))
+        )
+
+
+class PostgresFullText:
+    """Generated tsvector column jobs.search_vector with a GIN index"""
+    
+    @staticmethod
+    def search_query(terms: List[str], ranked: bool) -> Select:
+        vector = literal_column(f"{Job.__tablename__}.{SEARCH_VECTOR_COLUMN}")
+        tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        query = select(Job).where(vector.op("@@")(tsquery))
+        if ranked:
+            return query.order_by(func.ts_rank_cd(vector, tsquery).desc(), Job.id.desc())
+        return query.order_by(Job.applied_date.desc(), Job.id.desc())
+    
+    @staticmethod
+    def folded_contains(column_name: str, value: str) -> ColumnElement:
+        # Served by the gin_trgm_ops index on the shadow column
+        return getattr(Job, f"{column_name}_folded").like(folded_pattern(value))
+
+
+FULLTEXT_BACKENDS = {
+    "sqlite": SQLiteFullText,
+    "postgresql": PostgresFullText,
+}
+
+
+def get_fulltext_backend(dialect_name: str):
+    """
+    Full-text backend for a SQLAlchemy dialect name - one per supported
+    dialect (other databases are rejected at engine setup)
+    """
+    return FULLTEXT_BACKENDS[dialect_name]
+
+
+def is_fulltext_object(name: str) -> bool:
+    """Tables/columns/indexes owned by the search indexes (not mapped on the models)"""
+    return (
+        name in (SEARCH_VECTOR_COLUMN, SEARCH_VECTOR_INDEX, FTS_TABLE, FOLDED_FTS_TABLE)
+        or name.startswith(f"{FTS_TABLE}_")
+        or name.startswith(f"{FOLDED_FTS_TABLE}_")
+        or name.endswith(TRIGRAM_INDEX_SUFFIX)
+    )
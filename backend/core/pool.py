@@ -0,0 +1,88 @@
+"""
+Connection pool classes with checkout telemetry
+"""
+import threading
+import time
+from typing import Dict
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class PoolWaitStats:
+    """Thread-safe counters for time spent waiting on pool checkouts"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def record(self, wait: float, timed_out: bool = False):
+        """Record one checkout attempt"""
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if timed_out:
+                self.timeouts += 1
+    
+    def snapshot(self) -> Dict:
+        """Return the counters as a plain dict (times in milliseconds)"""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "total_wait_ms": round(self.total_wait * 1000, 3)
+            }
+
+
+class PoolTelemetryMixin:
+    """Times every connection checkout, including time blocked on a full pool"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(PoolTelemetryMixin, QueuePool):
+    """QueuePool for the sync engine"""
+
+
+class InstrumentedAsyncQueuePool(PoolTelemetryMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool for the async engine"""
+
+
+def get_pool_status(engine: Engine) -> Dict:
+    """Live pool statistics for an engine (sync or the sync_engine of an async engine)"""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+    
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout()
+        })
+    
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        status["wait"] = wait_stats.snapshot()
+    
+    return status
@@ -0,0 +1,167 @@
+"""
+Read/write routing - send read-only requests to replica databases
+Read-your-writes is per client: a client whose request committed a write gets
+a cookie with the commit time, and its reads stay on the primary for
+read_after_write seconds after that
+"""
+import itertools
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.dml import UpdateBase
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+READ_STRATEGIES = ("round_robin", "least_loaded")
+
+# Cookie holding the client's last committed write (unix time)
+LAST_WRITE_COOKIE = "last_write"
+
+# Per-request write state, set by ReadAfterWriteMiddleware
+_request_writes: ContextVar[Optional[Dict]] = ContextVar("request_writes", default=None)
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from the replica stored in session.info["read_engine"]
+    Flushes and INSERT/UPDATE/DELETE statements always go to the primary bind
+    """
+    
+    def get_bind(self, mapper=None, clause=None, **kw):
+        read_engine = self.info.get("read_engine")
+        if read_engine is not None and not self._flushing and not isinstance(clause, UpdateBase):
+            return read_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+@contextmanager
+def primary_reads(session):
+    """Send a routing session's reads to the primary inside the block"""
+    read_engine = session.info.pop("read_engine", None)
+    try:
+        yield session
+    finally:
+        if read_engine is not None:
+            session.info["read_engine"] = read_engine
+
+
+class ReadReplicaRouter:
+    """Chooses which replica serves the next read-only request"""
+    
+    def __init__(
+        self,
+        replicas: List[AsyncEngine],
+        strategy: str = "round_robin",
+        read_after_write: float = 0.0
+    ):
+        if strategy not in READ_STRATEGIES:
+            raise ValueError(f"Unknown read strategy '{strategy}', expected one of {READ_STRATEGIES}")
+        self.replicas = replicas
+        self.strategy = strategy
+        self.read_after_write = read_after_write
+        self._round_robin = itertools.cycle(replicas)
+    
+    def choose(self, last_write: Optional[float] = None) -> Optional[AsyncEngine]:
+        """
+        Replica for the next read, or None to stay on the primary
+        last_write: the requesting client's last committed write (unix time)
+        """
+        if not self.replicas:
+            return None
+        if last_write is not None and time.time() - last_write < self.read_after_write:
+            return None
+        if self.strategy == "least_loaded":
+            return min(self.replicas, key=self._checked_out)
+        return next(self._round_robin)
+    
+    @staticmethod
+    def _checked_out(replica: AsyncEngine) -> int:
+        pool = replica.sync_engine.pool
+        return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+def client_last_write() -> Optional[float]:
+    """Last committed write of the client behind the current request, if known"""
+    state = _request_writes.get()
+    if state is None:
+        return None
+    times = [value for value in (state["cookie"], state["committed_at"]) if value is not None]
+    return max(times, default=None)
+
+
+class ReadAfterWriteMiddleware:
+    """
+    Carry each client's last write time in a cookie: read it on the way in,
+    set it on the way out when the request committed a write
+    """
+    
+    def __init__(self, app: ASGIApp, window: float):
+        self.app = app
+        self.max_age = math.ceil(window)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        state = {"cookie": self.read_cookie(scope), "committed_at": None}
+        
+        async def send_with_cookie(message: Message):
+            if message["type"] == "http.response.start" and state["committed_at"] is not None:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{LAST_WRITE_COOKIE}={state['committed_at']:.3f}; Max-Age={self.max_age}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+            await send(message)
+        
+        token = _request_writes.set(state)
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            _request_writes.reset(token)
+    
+    @staticmethod
+    def read_cookie(scope: Scope) -> Optional[float]:
+        cookie = SimpleCookie(Headers(scope=scope).get("cookie", ""))
+        if LAST_WRITE_COOKIE not in cookie:
+            return None
+        try:
+            return float(cookie[LAST_WRITE_COOKIE].value)
+        except ValueError:
+            return None
+
+
+@event.listens_for(Session, "after_flush")
+def mark_replica_write(session, flush_context):
+    """Remember that this transaction wrote rows"""
+    session.info["replica_write"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def mark_statement_write(orm_execute_state):
+    """Bulk INSERT/UPDATE/DELETE statements write without a flush"""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["replica_write"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def record_committed_write(session):
+    """Only a committed write starts the client's read-after-write window"""
+    state = _request_writes.get()
+    if session.info.pop("replica_write", False) and state is not None:
+        state["committed_at"] = time.time()
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_replica_write(session):
+    """Rolled-back writes are not visible anywhere"""
+    session.info.pop("replica_write", None)
@@ -0,0 +1,68 @@
+"""
+Schema version management - Alembic revision check and migrations
+"""
+from pathlib import Path
+from typing import Optional
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# Revision matching the schema that Base.metadata.create_all used to build
+BASELINE_REVISION = "0001_initial_schema"
+
+
+class SchemaVersionError(RuntimeError):
+    """Database schema does not match the code's migration head"""
+
+
+def get_alembic_config() -> Config:
+    """Alembic config pointing at the repository's alembic.ini"""
+    return Config(str(ALEMBIC_INI))
+
+
+def get_head_revision() -> str:
+    """Latest migration revision shipped with the code"""
+    return ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+
+async def get_database_revision(async_engine: AsyncEngine) -> Optional[str]:
+    """Revision recorded in alembic_version, or None if the table is missing"""
+    try:
+        async with async_engine.connect() as connection:
+            return await connection.scalar(text("SELECT version_num FROM alembic_version"))
+    except DBAPIError:
+        return None
+
+
+async def check_schema_version(async_engine: AsyncEngine):
+    """
+    Fail fast when the database is not migrated to the code's head revision
+    One SELECT - no DDL, no table inspection
+    """
+    head = get_head_revision()
+    current = await get_database_revision(async_engine)
+    if current != head:
+        raise SchemaVersionError(
+            f"Database schema is at revision {current or 'none'}, expected {head}. "
+            f"Run: python scripts/init_db.py migrate"
+        )
+
+
+def migrate(engine: Engine) -> str:
+    """
+    Upgrade the database to the head revision and return it
+    Databases created by the old create_all startup hook are stamped with the
+    baseline revision first so their existing tables are not re-created
+    """
+    config = get_alembic_config()
+    table_names = inspect(engine).get_table_names()
+    if "jobs" in table_names and "alembic_version" not in table_names:
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+    return get_head_revision()
@@ -0,0 +1,44 @@
+"""
+SQLite performance mode - connection pragmas applied at engine creation
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from .config import settings
+
+
+def is_sqlite_file_url(url: str) -> bool:
+    """True for SQLite URLs backed by a file (not :memory:)"""
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def get_sqlite_pragmas(read_only: bool = False) -> list[str]:
+    """PRAGMA statements run on every new connection"""
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}",
+        "PRAGMA temp_store=MEMORY",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine: Engine, read_only: bool = False):
+    """
+    Register a connect listener that applies the performance pragmas
+    Pass async_engine.sync_engine for async engines
+    """
+    pragmas = get_sqlite_pragmas(read_only)
+    
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
@@ -0,0 +1,128 @@
+"""
+Timeline buckets - day/week/month/quarter periods over an arbitrary range
+Buckets are aligned to calendar boundaries (weeks start on Monday, ISO) and
+every bucket in the range is returned, including empty ones
+Also holds the dialect-specific date expressions the analytics queries share
+"""
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import Date, Integer, String, cast, func, literal, literal_column
+from backend.core.config import SUPPORTED_DIALECTS  # noqa: F401 - the dialects written for below
+
+PERIODS = ("day", "week", "month", "quarter")
+
+# Range used when the caller gives no start date
+DEFAULT_BUCKETS = {"day": 30, "week": 12, "month": 6, "quarter": 4}
+
+# Upper bound on buckets per request (10 years of weeks, ~2.7 years of days)
+MAX_BUCKETS = 1000
+
+
+def bucket_start(value: date, period: str) -> date:
+    """First day of the bucket containing value"""
+    if period == "day":
+        return value
+    if period == "week":
+        return value - timedelta(days=value.weekday())
+    if period == "month":
+        return value.replace(day=1)
+    if period == "quarter":
+        return date(value.year, (value.month - 1) // 3 * 3 + 1, 1)
+    raise ValueError(f"Unknown period '{period}', expected one of {PERIODS}")
+
+
+def next_bucket(start: date, period: str) -> date:
+    """First day of the bucket after the one starting at start"""
+    if period == "day":
+        return start + timedelta(days=1)
+    if period == "week":
+        return start + timedelta(weeks=1)
+    if period == "month":
+        return start + relativedelta(months=1)
+    return start + relativedelta(months=3)
+
+
+def bucket_label(start: date, period: str) -> str:
+    """Display label: 2025-01-31, 2025-W05, 2025-01, 2025-Q1"""
+    if period == "day":
+        return start.isoformat()
+    if period == "week":
+        year, week, _ = start.isocalendar()
+        return f"{year}-W{week:02d}"
+    if period == "month":
+        return start.strftime("%Y-%m")
+    return f"{start.year}-Q{(start.month - 1) // 3 + 1}"
+
+
+def get_buckets(
+    period: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    today: date
+) -> List[date]:
+    """
+    Start dates of every bucket overlapping [start_date, end_date]
+    end_date defaults to today; start_date to DEFAULT_BUCKETS buckets back
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period '{period}', expected one of {PERIODS}")
+    
+    last = bucket_start(end_date or today, period)
+    if start_date is None:
+        first = last
+        for _ in range(DEFAULT_BUCKETS[period] - 1):
+            first = bucket_start(first - timedelta(days=1), period)
+    else:
+        first = bucket_start(start_date, period)
+    if first > last:
+        raise ValueError("start_date must not be after end_date")
+    
+    buckets = [first]
+    while buckets[-1] < last:
+        buckets.append(next_bucket(buckets[-1], period))
+        if len(buckets) > MAX_BUCKETS:
+            raise ValueError(f"Range too large: more than {MAX_BUCKETS} {period} buckets")
+    return buckets
+
+
+def truncate(column, period: str, dialect_name: str):
+    """
+    SQL expression mapping a date/datetime column to its bucket start date
+    for one of SUPPORTED_DIALECTS
+    Range-filter on the raw column (not this expression) so the index is used
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period '{period}', expected one of {PERIODS}")
+    if dialect_name == "postgresql":
+        # Inline the unit so SELECT and GROUP BY are the same expression
+        return cast(func.date_trunc(literal_column(f"'{period}'"), column), Date)
+    # SQLite date() modifiers
+    if period == "day":
+        return func.date(column)
+    if period == "week":
+        # Next Sunday (or today if Sunday), then back to that week's Monday
+        return func.date(column, "weekday 0", "-6 days")
+    if period == "month":
+        return func.date(column, "start of month")
+    months_back = (cast(func.strftime("%m", column), Integer) - 1) % 3
+    return func.date(
+        column, "start of month",
+        literal("-").concat(cast(months_back, String)).concat(" months")
+    )
+
+
+def to_date(value) -> date:
+    """Normalize a bucket value from the driver (str on SQLite, date/datetime on PostgreSQL)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def days_between(later, earlier, dialect_name: str):
+    """SQL expression for the (fractional) number of days from earlier to later (SUPPORTED_DIALECTS)"""
+    if dialect_name == "postgresql":
+        return func.extract("epoch", later - earlier) / 86400.0
+    return func.julianday(later) - func.julianday(earlier)
@@ -4,8 +4,14 @@ FastAPI application entry point
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from backend.core.config import settings
-from backend.core.database import init_db
+from backend.core.compression import CompressionMiddleware
+from backend.core.database import engine, async_engine, read_engines, read_router
+from backend.core.pool import get_pool_status
+from backend.core.routing import ReadAfterWriteMiddleware
+from backend.core.schema import check_schema_version
 from backend.api.v1 import jobs, analytics, interviews
+from backend.services.analytics_service import analytics_cache
+from backend.utils.serialization import FastJSONResponse
 
 # Import all models to ensure relationships are registered
 import backend.models  # noqa: F401
@@ -16,7 +22,9 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="REST API for Job Tracker Application",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson rendering for every endpoint; list endpoints also skip revalidation
+    default_response_class=FastJSONResponse
 )
 
 # Configure CORS
@@ -28,6 +36,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-client read-your-writes when reads go to lagging replicas
+if read_router.read_after_write > 0:
+    app.add_middleware(ReadAfterWriteMiddleware, window=read_router.read_after_write)
+
+# Compress large JSON/text responses (added last so it wraps everything else)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        content_types=settings.COMPRESSION_CONTENT_TYPES
+    )
+
 # Include routers
 app.include_router(jobs.router, prefix=settings.API_V1_PREFIX)
 app.include_router(analytics.router, prefix=settings.API_V1_PREFIX)
@@ -37,9 +58,21 @@ app.include_router(interviews.router, prefix=settings.API_V1_PREFIX)
 
 
 @app.on_event("startup")
-def startup_event():
-    """Initialize database on startup"""
-    init_db()
+async def startup_event():
+    """
+    Verify the database is migrated (single SELECT on alembic_version)
+    Schema changes are applied by: python scripts/init_db.py migrate
+    """
+    if settings.SCHEMA_CHECK_ON_STARTUP:
+        await check_schema_version(async_engine)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled database connections on shutdown"""
+    await async_engine.dispose()
+    for read_engine in read_engines:
+        await read_engine.dispose()
 
 
 @app.get("/")
@@ -58,6 +91,24 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/cache")
+def cache_status():
+    """Analytics result cache statistics (data version, hits, misses, evictions)"""
+    return analytics_cache.snapshot()
+
+
+@app.get("/health/pool")
+def pool_status():
+    """Live connection pool statistics (checked-out, overflow, checkout wait time)"""
+    status = {
+        "api": get_pool_status(async_engine.sync_engine),
+        "sync": get_pool_status(engine)
+    }
+    if read_engines:
+        status["api_read"] = [get_pool_status(read_engine.sync_engine) for read_engine in read_engines]
+    return status
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -6,5 +6,14 @@ from backend.models.application import Application
 from backend.models.interview import Interview
 from backend.models.note import Note
 from backend.models.email_template import EmailTemplate
+from backend.models.rollup import (
+    JobStatusCount,
+    JobSourceStatusCount,
+    JobMonthStatusCount,
+    InterviewMonthCount
+)
 
-__all__ = ["Job", "Application", "Interview", "Note", "EmailTemplate"]
+__all__ = [
+    "Job", "Application", "Interview", "Note", "EmailTemplate",
+    "JobStatusCount", "JobSourceStatusCount", "JobMonthStatusCount", "InterviewMonthCount"
+]
@@ -1,7 +1,7 @@
 """
 Application model - Pipeline status history
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from backend.core.database import Base
@@ -10,6 +10,10 @@ from backend.core.database import Base
 class Application(Base):
     """Application status history model"""
     __tablename__ = "applications"
+    __table_args__ = (
+        # Status history of a job in order (LAG over status_date per job_id)
+        Index("ix_applications_job_history", "job_id", "status_date", "id", "status"),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -1,7 +1,8 @@
 """
 Interview model - Interview schedule and details
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, event, text, literal_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from backend.core.database import Base
@@ -10,17 +11,23 @@ from backend.core.database import Base
 class Interview(Base):
     """Interview schedule model"""
     __tablename__ = "interviews"
+    __table_args__ = (
+        # Interviews of a job ordered by round
+        Index("ix_interviews_job_round", "job_id", "round_number"),
+        # Upcoming / date-range lists filtered by result
+        Index("ix_interviews_scheduled_result", "scheduled_date", "result"),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     
     # Foreign Key
-    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
     
     # Interview Information
     round_number = Column(Integer, nullable=False)  # 1, 2, 3, etc.
     interview_type = Column(String(50), nullable=True)  # Phone, Video, Onsite, Technical
-    scheduled_date = Column(DateTime(timezone=True), nullable=False, index=True)
+    scheduled_date = Column(DateTime(timezone=True), nullable=False)
     
     # Location/Meeting
     location = Column(String(255), nullable=True)  # Physical location
@@ -38,6 +45,8 @@ class Interview(Base):
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Bumped by every UPDATE - ETags use it, updated_at has 1s resolution on SQLite
+    row_version = Column(Integer, nullable=False, server_default=text("1"), onupdate=literal_column("row_version") + 1)
     
     # Relationships
     job = relationship("Job", back_populates="interviews")
@@ -45,3 +54,15 @@ class Interview(Base):
     
     def __repr__(self):
         return f"<Interview(id={self.id}, job_id={self.job_id}, round={self.round_number}, date={self.scheduled_date})>"
+
+
+@event.listens_for(Interview, "before_insert")
+@event.listens_for(Interview, "before_update")
+def store_scheduled_date_utc(mapper, connection, target):
+    """
+    Store aware scheduled dates in UTC - SQLite drops the offset, so the
+    stored wall-clock time (and its rollup month) would otherwise be local
+    """
+    value = target.scheduled_date
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        target.scheduled_date = value.astimezone(timezone.utc)
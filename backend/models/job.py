@@ -1,15 +1,32 @@
 """
 Job model - Main entity for job applications
 """
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Boolean, Numeric
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Boolean, Numeric, Index, text, event, literal_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from backend.core.database import Base
+from backend.utils.text import fold_text
+
+# Columns with an accent-folded "<name>_folded" search copy
+FOLDED_COLUMNS = ("company_name", "job_title", "location")
 
 
 class Job(Base):
     """Job application model"""
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Job list ordering is (applied_date, id) so keyset pages are stable
+        Index("ix_jobs_applied_date", "applied_date", "id"),
+        # Status filter + default applied_date ordering of the job list
+        Index("ix_jobs_status_applied_date", "current_status", "applied_date", "id"),
+        Index("ix_jobs_work_type_applied_date", "work_type", "applied_date", "id"),
+        # Favorites are a small subset - partial index keeps it tiny
+        Index(
+            "ix_jobs_favorite_applied_date", "applied_date", "id",
+            sqlite_where=text("is_favorite = 1"),
+            postgresql_where=text("is_favorite")
+        ),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -34,14 +51,22 @@ class Job(Base):
     contact_phone = Column(String(20), nullable=True)
     
     # Status & Dates
-    current_status = Column(String(50), nullable=False, default="Applied", index=True)
-    applied_date = Column(Date, nullable=False, index=True)
+    current_status = Column(String(50), nullable=False, default="Applied")
+    applied_date = Column(Date, nullable=False)
     deadline = Column(Date, nullable=True)
     
+    # Search shadow columns - lowercased, accent-folded copies of the columns
+    # above, refreshed on every insert/update (see fold_search_columns)
+    company_name_folded = Column(String(255), nullable=True)
+    job_title_folded = Column(String(255), nullable=True)
+    location_folded = Column(String(255), nullable=True)
+    
     # Metadata
     is_favorite = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Bumped by every UPDATE - ETags use it, updated_at has 1s resolution on SQLite
+    row_version = Column(Integer, nullable=False, server_default=text("1"), onupdate=literal_column("row_version") + 1)
     
     # Relationships
     applications = relationship("Application", back_populates="job", cascade="all, delete-orphan")
@@ -50,3 +75,11 @@ class Job(Base):
     
     def __repr__(self):
         return f"<Job(id={self.id}, company='{self.company_name}', title='{self.job_title}', status='{self.current_status}')>"
+
+
+@event.listens_for(Job, "before_insert")
+@event.listens_for(Job, "before_update")
+def fold_search_columns(mapper, connection, target):
+    """Keep the *_folded search columns in sync with the displayed values"""
+    for name in FOLDED_COLUMNS:
+        setattr(target, f"{name}_folded", fold_text(getattr(target, name)))
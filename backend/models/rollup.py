@@ -0,0 +1,189 @@
+"""
+Analytics rollup models - pre-aggregated counts for the dashboard
+Kept in sync by a Session after_flush hook, so every ORM write (including
+cascade deletes) updates them in the same transaction as the change itself
+"""
+from collections import Counter
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, Integer, String, event, inspect, func, select, delete
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from backend.core.database import Base
+from backend.models.job import Job
+from backend.models.interview import Interview
+
+MONTH_FORMAT = "%Y-%m"
+
+
+class JobStatusCount(Base):
+    """Jobs per current status"""
+    __tablename__ = "job_status_counts"
+    
+    status = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class JobSourceStatusCount(Base):
+    """Jobs per source x current status (jobs without a source are not counted)"""
+    __tablename__ = "job_source_status_counts"
+    
+    source = Column(String(100), primary_key=True)
+    status = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class JobMonthStatusCount(Base):
+    """Jobs per applied month (YYYY-MM) x current status"""
+    __tablename__ = "job_month_status_counts"
+    
+    month = Column(String(7), primary_key=True)
+    status = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class InterviewMonthCount(Base):
+    """Interviews per scheduled month (YYYY-MM)"""
+    __tablename__ = "interview_month_counts"
+    
+    month = Column(String(7), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+def _values(target, attributes, previous: bool) -> tuple:
+    """Attribute values of a flushed object - before the flush if previous"""
+    state = inspect(target)
+    values = []
+    for name in attributes:
+        history = state.attrs[name].history
+        if previous and history.deleted:
+            values.append(history.deleted[0])
+        else:
+            values.append(getattr(target, name))
+    return tuple(values)
+
+
+def month_of(value) -> str:
+    """
+    YYYY-MM of a date/datetime; aware datetimes are taken in UTC so the month
+    matches month_key() over the stored value
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime(MONTH_FORMAT)
+
+
+def _job_keys(status, source, applied_date) -> list:
+    """Rollup rows a job with these values is counted in"""
+    keys = [(JobStatusCount, {"status": status})]
+    if source is not None:
+        keys.append((JobSourceStatusCount, {"source": source, "status": status}))
+    if applied_date is not None:
+        keys.append((JobMonthStatusCount, {"month": month_of(applied_date), "status": status}))
+    return keys
+
+
+def _interview_keys(scheduled_date) -> list:
+    """Rollup rows an interview with this date is counted in"""
+    if scheduled_date is None:
+        return []
+    return [(InterviewMonthCount, {"month": month_of(scheduled_date)})]
+
+
+def collect_rollup_deltas(session: Session) -> Counter:
+    """Net count change per rollup row for the objects in this flush"""
+    deltas = Counter()
+    
+    def add(keys, delta):
+        for model, key in keys:
+            deltas[(model, tuple(sorted(key.items())))] += delta
+    
+    job_fields = ("current_status", "source", "applied_date")
+    interview_fields = ("scheduled_date",)
+    
+    for obj in session.new:
+        if isinstance(obj, Job):
+            add(_job_keys(*_values(obj, job_fields, previous=False)), 1)
+        elif isinstance(obj, Interview):
+            add(_interview_keys(*_values(obj, interview_fields, previous=False)), 1)
+    
+    for obj in session.dirty:
+        if isinstance(obj, Job) and session.is_modified(obj):
+            add(_job_keys(*_values(obj, job_fields, previous=True)), -1)
+            add(_job_keys(*_values(obj, job_fields, previous=False)), 1)
+        elif isinstance(obj, Interview) and session.is_modified(obj):
+            add(_interview_keys(*_values(obj, interview_fields, previous=True)), -1)
+            add(_interview_keys(*_values(obj, interview_fields, previous=False)), 1)
+    
+    for obj in session.deleted:
+        if isinstance(obj, Job):
+            add(_job_keys(*_values(obj, job_fields, previous=True)), -1)
+        elif isinstance(obj, Interview):
+            add(_interview_keys(*_values(obj, interview_fields, previous=True)), -1)
+    
+    return Counter({key: delta for key, delta in deltas.items() if delta})
+
+
+def increment_rollup(connection, model, key: dict, delta: int):
+    """
+    Add delta to one rollup row, creating it if needed (single upsert)
+    Both supported dialects (see check_supported_database) have ON CONFLICT
+    """
+    insert = postgresql_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    table = model.__table__
+    statement = insert(table).values(**key, count=delta)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(key),
+        set_={"count": table.c.count + statement.excluded.count}
+    )
+    connection.execute(statement)
+
+
+def month_key(column, dialect_name: str):
+    """
+    SQL expression formatting a date/datetime column as YYYY-MM, in UTC for
+    timestamptz columns (SQLite stores datetimes as naive UTC already)
+    """
+    if dialect_name == "postgresql":
+        if isinstance(column.type, DateTime) and column.type.timezone:
+            column = func.timezone("UTC", column)
+        return func.to_char(column, "YYYY-MM")
+    return func.strftime(MONTH_FORMAT, column)
+
+
+def rebuild_rollups(connection):
+    """
+    Recompute every rollup table from jobs/interviews (drift repair)
+    Run with: python scripts/init_db.py rebuild-rollups
+    """
+    dialect_name = connection.dialect.name
+    job_month = month_key(Job.applied_date, dialect_name)
+    interview_month = month_key(Interview.scheduled_date, dialect_name)
+    
+    aggregates = [
+        (JobStatusCount, select(Job.current_status, func.count()).group_by(Job.current_status)),
+        (JobSourceStatusCount, select(Job.source, Job.current_status, func.count())
+            .where(Job.source.isnot(None))
+            .group_by(Job.source, Job.current_status)),
+        (JobMonthStatusCount, select(job_month, Job.current_status, func.count())
+            .group_by(job_month, Job.current_status)),
+        (InterviewMonthCount, select(interview_month, func.count())
+            .where(Interview.scheduled_date.isnot(None))
+            .group_by(interview_month)),
+    ]
+    for model, aggregate in aggregates:
+        table = model.__table__
+        connection.execute(delete(table))
+        connection.execute(table.insert().from_select([column.name for column in table.columns], aggregate))
+
+
+@event.listens_for(Session, "after_flush")
+def update_rollups(session, flush_context):
+    """Apply this flush's job/interview changes to the rollup tables"""
+    deltas = collect_rollup_deltas(session)
+    if not deltas:
+        return
+    
+    connection = session.connection()
+    for (model, key), delta in deltas.items():
+        increment_rollup(connection, model, dict(key), delta)
@@ -2,7 +2,7 @@
 Analytics schemas for response validation
 """
 from pydantic import BaseModel
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class StatusStatistics(BaseModel):
@@ -24,7 +24,7 @@ class SourceStatistics(BaseModel):
 
 class TimelineStatistics(BaseModel):
     """Timeline statistics"""
-    period: str  # e.g., "2025-01", "Week 1"
+    period: str  # e.g., "2025-01-31", "2025-W05", "2025-01", "2025-Q1"
     applications: int
     interviews: int
     offers: int
@@ -32,6 +32,109 @@ class TimelineStatistics(BaseModel):
     rejected: int
 
 
+class FunnelStage(BaseModel):
+    """Jobs that reached a pipeline stage (or a later one)"""
+    status: str
+    reached: int
+    rejected: int  # rejected with this as the furthest stage reached
+    conversion_rate: Optional[float]  # reached / reached of the previous stage (%)
+
+
+class StageTransition(BaseModel):
+    """Status changes from one status to another (Sankey link)"""
+    from_status: str
+    to_status: str
+    count: int
+
+
+class FunnelResponse(BaseModel):
+    """Pipeline funnel and transition matrix from the status history"""
+    total_jobs: int
+    rejected: int
+    stages: List[FunnelStage]
+    transitions: List[StageTransition]
+
+
+class StageTimeStatistics(BaseModel):
+    """Days spent in a status before the next status change"""
+    status: str
+    count: int  # finished stays
+    in_stage: int  # jobs currently in this status
+    mean_days: Optional[float]
+    p50_days: Optional[float]
+    p75_days: Optional[float]
+    p90_days: Optional[float]
+
+
+class SourceStageTimeStatistics(StageTimeStatistics):
+    """Time in stage for jobs from one source"""
+    source: str
+
+
+class TimeInStageResponse(BaseModel):
+    """Time-in-stage percentile tables"""
+    percentiles: List[int]
+    by_status: List[StageTimeStatistics]
+    by_source: List[SourceStageTimeStatistics]
+
+
+class CohortStage(BaseModel):
+    """How many jobs of a cohort reached a stage, and how fast"""
+    status: str
+    reached: int
+    rate: float  # reached / cohort jobs (%)
+    average_days: Optional[float]  # applied_date -> first time at this stage or later
+
+
+class Cohort(BaseModel):
+    """Jobs applied in one month"""
+    cohort: str  # YYYY-MM
+    jobs: int
+    stages: List[CohortStage]
+
+
+class CohortResponse(BaseModel):
+    """Cohort x stage matrix"""
+    stages: List[str]
+    cohorts: List[Cohort]
+
+
+class SalaryStatistics(BaseModel):
+    """Salary distribution (midpoint of min/max, normalized currency)"""
+    count: int
+    mean: Optional[float]
+    min: Optional[float]
+    max: Optional[float]
+    p25: Optional[float]
+    median: Optional[float]
+    p75: Optional[float]
+    p90: Optional[float]
+
+
+class SalaryGroupStatistics(SalaryStatistics):
+    """Salary distribution for one source / location / work type"""
+    key: str
+
+
+class SalaryHistogramBin(BaseModel):
+    """Jobs with a salary in [start, end)"""
+    start: float
+    end: float
+    count: int
+
+
+class SalaryAnalyticsResponse(BaseModel):
+    """Salary analytics in one currency"""
+    currency: str
+    fx_rates: Dict[str, float]  # units of `currency` per 1 unit of each currency
+    skipped: int  # jobs whose currency has no FX rate
+    overall: SalaryStatistics
+    histogram: List[SalaryHistogramBin]
+    by_source: List[SalaryGroupStatistics]
+    by_location: List[SalaryGroupStatistics]
+    by_work_type: List[SalaryGroupStatistics]
+
+
 class AnalyticsSummary(BaseModel):
     """Overall analytics summary"""
     total_applications: int
@@ -41,7 +144,10 @@ class AnalyticsSummary(BaseModel):
     offers_received: int
     hired_count: int
     rejected_count: int
-    average_response_time_days: float
+    responded_applications: int  # jobs with a first response after Applied
+    average_response_time_days: Optional[float]
+    median_response_time_days: Optional[float]
+    p90_response_time_days: Optional[float]
     success_rate: float
 
 
@@ -2,7 +2,7 @@
 Interview schemas for request/response validation
 """
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
 
@@ -51,7 +51,7 @@ class InterviewResponse(InterviewBase):
 
 class InterviewListResponse(BaseModel):
     """Schema for interview list"""
-    items: list[InterviewResponse]
+    items: list[InterviewResponse]  # only the requested columns with ?fields=
     total: int
 
 
@@ -62,3 +62,4 @@ class InterviewFilter(BaseModel):
     result: Optional[str] = None
     scheduled_date_from: Optional[datetime] = None
     scheduled_date_to: Optional[datetime] = None
+    fields: Optional[Tuple[str, ...]] = None  # sparse fieldset; None loads every column
@@ -1,10 +1,15 @@
 """
 Job schemas for request/response validation
 """
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from collections import Counter
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import List, Optional, Tuple
 from datetime import date, datetime
 from decimal import Decimal
+from backend.utils.constants import CountMode, JobStatus
+
+# Largest batch accepted by the bulk endpoints (one transaction each)
+BULK_MAX_ITEMS = 500
 
 
 # Base schema with common fields
@@ -57,6 +62,34 @@ class JobUpdate(BaseModel):
     is_favorite: Optional[bool] = None
 
 
+# Schemas for bulk operations
+class JobBulkCreate(BaseModel):
+    """Schema for creating many jobs in one transaction"""
+    items: List[JobCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class JobStatusChange(BaseModel):
+    """One status transition of a bulk status update"""
+    job_id: int
+    new_status: JobStatus
+    notes: Optional[str] = None
+
+
+class JobBulkStatusUpdate(BaseModel):
+    """Schema for moving many jobs to new statuses in one transaction"""
+    items: List[JobStatusChange] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+    
+    @field_validator("items")
+    @classmethod
+    def unique_job_ids(cls, items: List[JobStatusChange]) -> List[JobStatusChange]:
+        """A job may appear once per batch - the final status would be ambiguous"""
+        counts = Counter(item.job_id for item in items)
+        duplicates = [job_id for job_id, count in counts.items() if count > 1]
+        if duplicates:
+            raise ValueError(f"Duplicate job_id in batch: {', '.join(map(str, sorted(duplicates)))}")
+        return items
+
+
 # Schema for job response
 class JobResponse(JobBase):
     """Schema for job response"""
@@ -70,11 +103,29 @@ class JobResponse(JobBase):
 # Schema for job list with pagination
 class JobListResponse(BaseModel):
     """Schema for paginated job list"""
-    items: list[JobResponse]
-    total: int
+    items: list[JobResponse]  # only the requested columns with ?fields=
+    total: Optional[int] = None  # null when requested with count=none
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # pass as ?cursor= to fetch the next page
+
+
+# Schemas for bulk operation results
+class JobBulkItemResult(BaseModel):
+    """Outcome of one item of a bulk request, in request order"""
+    index: int
+    job_id: Optional[int] = None
+    status: str  # created, updated or not_found
+    job: Optional[JobResponse] = None
+
+
+class JobBulkResponse(BaseModel):
+    """Per-item results of a bulk request"""
+    total: int
+    succeeded: int
+    failed: int
+    results: list[JobBulkItemResult]
 
 
 # Schema for job search/filter
@@ -91,5 +142,8 @@ class JobFilter(BaseModel):
     applied_date_to: Optional[date] = None
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = None  # keyset cursor; takes precedence over page
+    count: CountMode = CountMode.EXACT
     sort_by: str = "applied_date"
     sort_order: str = "desc"  # asc or desc
+    fields: Optional[Tuple[str, ...]] = None  # sparse fieldset; None loads every column
@@ -2,5 +2,7 @@
 from backend.services.job_service import JobService
 from backend.services.interview_service import InterviewService
 from backend.services.analytics_service import AnalyticsService
+from backend.services.stage_time_service import StageTimeService
+from backend.services.salary_service import SalaryService
 
-__all__ = ["JobService", "InterviewService", "AnalyticsService"]
+__all__ = ["JobService", "InterviewService", "AnalyticsService", "StageTimeService", "SalaryService"]
@@ -1,46 +1,188 @@
 """
 Analytics service - Business logic for analytics and reports
 """
+from collections import defaultdict
+from itertools import chain
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, literal, null, cast, case, String, union_all, event
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case
-from typing import List, Dict
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+from typing import List, Dict, Iterable, Optional, Tuple
+from datetime import date, datetime, time
+from backend.core.cache import VersionedCache
+from backend.core.config import settings
+from backend.core.database import read_router
+from backend.core.routing import primary_reads
+from backend.core.timeline import bucket_label, bucket_start, days_between, get_buckets, next_bucket, to_date, truncate
 from backend.models.job import Job
 from backend.models.application import Application
 from backend.models.interview import Interview
+from backend.models.rollup import (
+    JobStatusCount,
+    JobSourceStatusCount,
+    JobMonthStatusCount,
+    InterviewMonthCount,
+    MONTH_FORMAT
+)
 from backend.utils.constants import JobStatus, PIPELINE_ORDER
 
+ACTIVE_STATUSES = [JobStatus.APPLIED, JobStatus.SCREENING, JobStatus.INTERVIEW, JobStatus.OFFER]
+
+# Sections of the combined rollup query (see fetch_rollups)
+STATUS = "status"
+SOURCE_STATUS = "source_status"
+MONTH_STATUS = "month_status"
+INTERVIEW_MONTH = "interview_month"
+UPCOMING = "upcoming"
+ALL_SECTIONS = (STATUS, SOURCE_STATUS, MONTH_STATUS, INTERVIEW_MONTH, UPCOMING)
+
+# Buckets made of whole months are served from the month rollups
+ROLLUP_PERIODS = ("month", "quarter")
+
+# Results only change when these tables are written
+ANALYTICS_MODELS = (Job, Application, Interview)
+
+# Replicas may not have a just-bumped write yet, and whatever a miss computes
+# is served to every client until the next bump - fill from the primary
+analytics_cache = VersionedCache(
+    max_entries=settings.ANALYTICS_CACHE_MAX_ENTRIES,
+    ttl=settings.ANALYTICS_CACHE_TTL,
+    fill_context=primary_reads if read_router.read_after_write > 0 else None
+)
+
+
+@event.listens_for(Session, "after_flush")
+def mark_analytics_write(session, flush_context):
+    """Remember that this transaction wrote data the analytics depend on"""
+    changed = chain(session.new, session.dirty, session.deleted)
+    if any(isinstance(obj, ANALYTICS_MODELS) for obj in changed):
+        session.info["analytics_write"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def bump_analytics_version(session):
+    """Invalidate cached analytics once the write is visible to readers"""
+    if session.info.pop("analytics_write", False):
+        analytics_cache.bump_version()
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_analytics_write(session):
+    """Rolled-back writes change nothing"""
+    session.info.pop("analytics_write", None)
+
 
 class AnalyticsService:
     
     @staticmethod
-    def get_summary_statistics(db: Session) -> Dict:
-        """Get overall summary statistics - OPTIMIZED: 9 queries → 2 queries"""
+    async def fetch_rollups(
+        db: AsyncSession,
+        sections: Iterable[str],
+        now: datetime
+    ) -> Dict[str, List[tuple]]:
+        """
+        Read the requested analytics sections in ONE statement (UNION ALL over
+        the rollup tables plus the upcoming-interviews range count)
+        Returns {section: [(key1, key2, count), ...]}
+        """
+        no_key = cast(null(), String)
+        queries = {
+            STATUS: select(
+                literal(STATUS).label("section"), JobStatusCount.status.label("key1"),
+                no_key.label("key2"), JobStatusCount.count
+            ).where(JobStatusCount.count > 0),
+            SOURCE_STATUS: select(
+                literal(SOURCE_STATUS), JobSourceStatusCount.source,
+                JobSourceStatusCount.status, JobSourceStatusCount.count
+            ).where(JobSourceStatusCount.count > 0),
+            MONTH_STATUS: select(
+                literal(MONTH_STATUS), JobMonthStatusCount.month,
+                JobMonthStatusCount.status, JobMonthStatusCount.count
+            ).where(
+                JobMonthStatusCount.month >= get_buckets("month", None, None, now.date())[0].strftime(MONTH_FORMAT),
+                JobMonthStatusCount.count > 0
+            ),
+            # All months: the summary needs the interview total, the timeline the recent months
+            INTERVIEW_MONTH: select(
+                literal(INTERVIEW_MONTH), InterviewMonthCount.month, no_key, InterviewMonthCount.count
+            ).where(InterviewMonthCount.count > 0),
+            # Upcoming depends on "now" so it cannot be rolled up; range count on the scheduled_date index
+            UPCOMING: select(
+                literal(UPCOMING), no_key, no_key, func.count(Interview.id)
+            ).where(Interview.scheduled_date >= now),
+        }
         
-        active_statuses = [JobStatus.APPLIED, JobStatus.SCREENING, JobStatus.INTERVIEW, JobStatus.OFFER]
-        now = datetime.now()
+        sections = list(sections)
+        if len(sections) == 1:
+            statement = queries[sections[0]]
+        else:
+            statement = union_all(*[queries[section] for section in sections])
+        rows = (await db.execute(statement)).all()
+        
+        results = {section: [] for section in sections}
+        for section, key1, key2, count in rows:
+            results[section].append((key1, key2, count))
+        return results
+    
+    @staticmethod
+    async def fetch_response_times(db: AsyncSession) -> Dict:
+        """
+        Days from Applied to the next status change, over every job whose
+        history has one - average, median and p90 (nearest rank)
+        One windowed statement: LAG over status_date per job_id reads
+        ix_applications_job_history in order, then ROW_NUMBER over the gaps
+        """
+        history = (Application.job_id, Application.status_date, Application.id)
+        window = {"partition_by": Application.job_id, "order_by": history[1:]}
+        steps = select(
+            func.row_number().over(**window).label("step"),
+            func.lag(Application.status).over(**window).label("previous_status"),
+            days_between(
+                Application.status_date,
+                func.lag(Application.status_date).over(**window),
+                db.get_bind().dialect.name
+            ).label("days")
+        ).subquery()
         
-        job_stats = db.query(
-            func.count(Job.id).label('total'),
-            func.sum(case((Job.current_status.in_([s.value for s in active_statuses]), 1), else_=0)).label('active'),
-            func.sum(case((Job.current_status == JobStatus.OFFER.value, 1), else_=0)).label('offers'),
-            func.sum(case((Job.current_status == JobStatus.HIRED.value, 1), else_=0)).label('hired'),
-            func.sum(case((Job.current_status == JobStatus.REJECTED.value, 1), else_=0)).label('rejected')
-        ).first()
-        
-        interview_stats = db.query(
-            func.count(Interview.id).label('total'),
-            func.sum(case((Interview.scheduled_date >= now, 1), else_=0)).label('upcoming')
-        ).first()
-        
-        total_applications = getattr(job_stats, 'total', 0) or 0
-        active_applications = getattr(job_stats, 'active', 0) or 0
-        offers_received = getattr(job_stats, 'offers', 0) or 0
-        hired_count = getattr(job_stats, 'hired', 0) or 0
-        rejected_count = getattr(job_stats, 'rejected', 0) or 0
-        total_interviews = getattr(interview_stats, 'total', 0) or 0
-        upcoming_interviews = getattr(interview_stats, 'upcoming', 0) or 0
+        # First transition of each job, when it starts from Applied
+        responses = select(
+            steps.c.days,
+            func.row_number().over(order_by=steps.c.days).label("rank"),
+            func.count().over().label("total")
+        ).where(
+            steps.c.step == 2,
+            steps.c.previous_status == JobStatus.APPLIED.value
+        ).subquery()
+        
+        # Nearest-rank percentiles: ceil(p * n) in integer arithmetic
+        median_rank = (responses.c.total + 1) // 2
+        p90_rank = (responses.c.total * 9 + 9) // 10
+        row = (await db.execute(select(
+            func.count(),
+            func.avg(responses.c.days),
+            func.max(case((responses.c.rank == median_rank, responses.c.days))),
+            func.max(case((responses.c.rank == p90_rank, responses.c.days)))
+        ))).one()
+        
+        count, average, median, p90 = row
+        return {
+            "responded_applications": count,
+            "average_response_time_days": round(float(average), 1) if count else None,
+            "median_response_time_days": round(float(median), 1) if count else None,
+            "p90_response_time_days": round(float(p90), 1) if count else None
+        }
+    
+    @staticmethod
+    def build_summary(rollups: Dict[str, List[tuple]], response_times: Dict) -> Dict:
+        """Summary section from STATUS, INTERVIEW_MONTH and UPCOMING rollup rows"""
+        status_counts = {status: count for status, _, count in rollups[STATUS]}
+        
+        total_applications = sum(status_counts.values())
+        active_applications = sum(status_counts.get(s.value, 0) for s in ACTIVE_STATUSES)
+        offers_received = status_counts.get(JobStatus.OFFER.value, 0)
+        hired_count = status_counts.get(JobStatus.HIRED.value, 0)
+        rejected_count = status_counts.get(JobStatus.REJECTED.value, 0)
+        total_interviews = sum(count for _, _, count in rollups[INTERVIEW_MONTH])
+        upcoming_interviews = sum(count for _, _, count in rollups[UPCOMING])
         
         success_rate = 0.0
         if (hired_count + rejected_count) > 0:
@@ -54,22 +196,18 @@ class AnalyticsService:
             "offers_received": offers_received,
             "hired_count": hired_count,
             "rejected_count": rejected_count,
-            "average_response_time_days": 7.5,
+            **response_times,
             "success_rate": round(success_rate, 2)
         }
     
     @staticmethod
-    def get_statistics_by_status(db: Session) -> List[Dict]:
-        
-        total = db.query(func.count(Job.id)).scalar() or 1
-        
-        results = db.query(
-            Job.current_status,
-            func.count(Job.id).label('count')
-        ).group_by(Job.current_status).all()
+    def build_statistics_by_status(rollups: Dict[str, List[tuple]]) -> List[Dict]:
+        """By-status section from STATUS rollup rows"""
+        status_counts = sorted((status, count) for status, _, count in rollups[STATUS])
+        total = sum(count for _, count in status_counts) or 1
         
         statistics = []
-        for status, count in results:
+        for status, count in status_counts:
             statistics.append({
                 "status": status,
                 "count": count,
@@ -79,102 +217,338 @@ class AnalyticsService:
         return statistics
     
     @staticmethod
-    def get_statistics_by_source(db: Session) -> List[Dict]:
-        
-        results = db.query(
-            Job.source,
-            func.count(Job.id).label('total'),
-            func.sum(case((Job.current_status == JobStatus.HIRED.value, 1), else_=0)).label('hired'),
-            func.sum(case((Job.current_status == JobStatus.REJECTED.value, 1), else_=0)).label('rejected'),
-            func.sum(case((Job.current_status.in_([
-                JobStatus.APPLIED.value,
-                JobStatus.SCREENING.value,
-                JobStatus.INTERVIEW.value,
-                JobStatus.OFFER.value
-            ]), 1), else_=0)).label('in_progress')
-        ).filter(Job.source.isnot(None)).group_by(Job.source).all()
+    def build_statistics_by_source(rollups: Dict[str, List[tuple]]) -> List[Dict]:
+        """By-source section from SOURCE_STATUS rollup rows"""
+        in_progress_statuses = {s.value for s in ACTIVE_STATUSES}
+        sources = defaultdict(lambda: {"total": 0, "hired": 0, "rejected": 0, "in_progress": 0})
+        for source, status, count in rollups[SOURCE_STATUS]:
+            totals = sources[source]
+            totals["total"] += count
+            if status == JobStatus.HIRED.value:
+                totals["hired"] += count
+            elif status == JobStatus.REJECTED.value:
+                totals["rejected"] += count
+            elif status in in_progress_statuses:
+                totals["in_progress"] += count
         
         statistics = []
-        for source, total, hired, rejected, in_progress in results:
+        for source, totals in sorted(sources.items()):
+            hired, rejected = totals["hired"], totals["rejected"]
             success_rate = 0.0
             if (hired + rejected) > 0:
                 success_rate = (hired / (hired + rejected)) * 100
             
             statistics.append({
                 "source": source,
-                "total_applications": total,
-                "hired_count": hired or 0,
-                "rejected_count": rejected or 0,
-                "in_progress_count": in_progress or 0,
+                "total_applications": totals["total"],
+                "hired_count": hired,
+                "rejected_count": rejected,
+                "in_progress_count": totals["in_progress"],
                 "success_rate": round(success_rate, 2)
             })
         
         return statistics
     
     @staticmethod
-    def get_timeline_statistics(db: Session, period: str = "month") -> List[Dict]:
-        """Get timeline statistics - OPTIMIZED: 30 queries → 2 queries"""
+    async def fetch_month_rollups(
+        db: AsyncSession,
+        range_start: date,
+        range_end: date
+    ) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Job (month, status, count) and interview (month, None, count) rollup
+        rows for the months in [range_start, range_end) - one statement
+        """
+        first, last = range_start.strftime(MONTH_FORMAT), range_end.strftime(MONTH_FORMAT)
+        statement = union_all(
+            select(
+                literal(MONTH_STATUS).label("section"), JobMonthStatusCount.month,
+                JobMonthStatusCount.status, JobMonthStatusCount.count
+            ).where(
+                JobMonthStatusCount.month >= first,
+                JobMonthStatusCount.month < last,
+                JobMonthStatusCount.count > 0
+            ),
+            select(
+                literal(INTERVIEW_MONTH), InterviewMonthCount.month,
+                cast(null(), String), InterviewMonthCount.count
+            ).where(
+                InterviewMonthCount.month >= first,
+                InterviewMonthCount.month < last,
+                InterviewMonthCount.count > 0
+            )
+        )
+        rows = (await db.execute(statement)).all()
+        job_rows = [(month, status, count) for section, month, status, count in rows if section == MONTH_STATUS]
+        interview_rows = [(month, None, count) for section, month, _, count in rows if section == INTERVIEW_MONTH]
+        return job_rows, interview_rows
+    
+    @staticmethod
+    async def fetch_timeline_buckets(
+        db: AsyncSession,
+        period: str,
+        range_start: date,
+        range_end: date
+    ) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Job (bucket, status, count) and interview (bucket, None, count) rows
+        grouped live by the dialect's date truncation - one statement, with
+        plain range predicates so the applied_date/scheduled_date indexes apply
+        """
+        dialect_name = db.get_bind().dialect.name
+        job_bucket = truncate(Job.applied_date, period, dialect_name)
+        interview_bucket = truncate(Interview.scheduled_date, period, dialect_name)
+        statement = union_all(
+            select(
+                literal(MONTH_STATUS).label("section"), job_bucket.label("bucket"),
+                Job.current_status.label("status"), func.count().label("count")
+            ).where(
+                Job.applied_date >= range_start,
+                Job.applied_date < range_end
+            ).group_by(job_bucket, Job.current_status),
+            select(
+                literal(INTERVIEW_MONTH), interview_bucket, cast(null(), String), func.count()
+            ).where(
+                Interview.scheduled_date >= datetime.combine(range_start, time.min),
+                Interview.scheduled_date < datetime.combine(range_end, time.min)
+            ).group_by(interview_bucket)
+        )
+        rows = (await db.execute(statement)).all()
+        job_rows = [(to_date(bucket), status, count) for section, bucket, status, count in rows if section == MONTH_STATUS]
+        interview_rows = [(to_date(bucket), None, count) for section, bucket, _, count in rows if section == INTERVIEW_MONTH]
+        return job_rows, interview_rows
+    
+    @staticmethod
+    def month_rows_to_buckets(rows: Iterable[tuple], period: str) -> List[tuple]:
+        """Map YYYY-MM rollup keys to the start date of their month/quarter bucket"""
+        return [
+            (bucket_start(datetime.strptime(month, MONTH_FORMAT).date(), period), key2, count)
+            for month, key2, count in rows
+        ]
+    
+    @staticmethod
+    def build_timeline(
+        job_rows: Iterable[tuple],
+        interview_rows: Iterable[tuple],
+        buckets: List[date],
+        period: str
+    ) -> List[Dict]:
+        """One entry per bucket (empty buckets included) from (bucket, status, count) rows"""
+        totals = {
+            bucket: {"applications": 0, "interviews": 0, "offers": 0, "hired": 0, "rejected": 0}
+            for bucket in buckets
+        }
+        for bucket, status, count in job_rows:
+            entry = totals.get(bucket)
+            if entry is None:
+                continue
+            entry["applications"] += count
+            if status == JobStatus.OFFER.value:
+                entry["offers"] += count
+            elif status == JobStatus.HIRED.value:
+                entry["hired"] += count
+            elif status == JobStatus.REJECTED.value:
+                entry["rejected"] += count
+        for bucket, _, count in interview_rows:
+            if bucket in totals:
+                totals[bucket]["interviews"] += count
         
-        now = datetime.now()
-        statistics = []
+        return [{"period": bucket_label(bucket, period), **totals[bucket]} for bucket in buckets]
+    
+    @staticmethod
+    @analytics_cache.cached
+    async def get_summary_statistics(db: AsyncSession) -> Dict:
+        """Get overall summary statistics - rollup counts plus response times"""
+        rollups = await AnalyticsService.fetch_rollups(db, (STATUS, INTERVIEW_MONTH, UPCOMING), datetime.now())
+        return AnalyticsService.build_summary(rollups, await AnalyticsService.fetch_response_times(db))
+    
+    @staticmethod
+    @analytics_cache.cached
+    async def get_statistics_by_status(db: AsyncSession) -> List[Dict]:
+        rollups = await AnalyticsService.fetch_rollups(db, (STATUS,), datetime.now())
+        return AnalyticsService.build_statistics_by_status(rollups)
+    
+    @staticmethod
+    @analytics_cache.cached
+    async def get_statistics_by_source(db: AsyncSession) -> List[Dict]:
+        rollups = await AnalyticsService.fetch_rollups(db, (SOURCE_STATUS,), datetime.now())
+        return AnalyticsService.build_statistics_by_source(rollups)
+    
+    @staticmethod
+    @analytics_cache.cached
+    async def get_timeline_statistics(
+        db: AsyncSession,
+        period: str = "month",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[Dict]:
+        """
+        Timeline per day/week/month/quarter over [start_date, end_date]
+        Month and quarter read the month rollups, day and week group the rows
+        in range; either way a single statement
+        """
+        buckets = get_buckets(period, start_date, end_date, date.today())
+        range_start, range_end = buckets[0], next_bucket(buckets[-1], period)
         
-        for i in range(5, -1, -1):
-            month_start = (now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) 
-                          - relativedelta(months=i))
-            month_end = month_start + relativedelta(months=1)
-            
-            statistics.append({
-                "period": month_start.strftime("%Y-%m"),
-                "month_start": month_start,
-                "month_end": month_end,
-                "month_start_date": month_start.date(),
-                "month_end_date": month_end.date()
+        if period in ROLLUP_PERIODS:
+            job_rows, interview_rows = await AnalyticsService.fetch_month_rollups(db, range_start, range_end)
+            job_rows = AnalyticsService.month_rows_to_buckets(job_rows, period)
+            interview_rows = AnalyticsService.month_rows_to_buckets(interview_rows, period)
+        else:
+            job_rows, interview_rows = await AnalyticsService.fetch_timeline_buckets(db, period, range_start, range_end)
+        
+        return AnalyticsService.build_timeline(job_rows, interview_rows, buckets, period)
+    
+    @staticmethod
+    @analytics_cache.cached
+    async def get_funnel(db: AsyncSession) -> Dict:
+        """
+        Stage reach counts and the from -> to transition matrix, computed from
+        the applications history in one statement
+        A job counts as reaching every pipeline stage up to the furthest one in
+        its history, so jobs rejected after an interview still count there
+        """
+        window = {"partition_by": Application.job_id, "order_by": (Application.status_date, Application.id)}
+        stage_rank = case(
+            {status.value: rank for rank, status in enumerate(PIPELINE_ORDER, start=1)},
+            value=Application.status,
+            else_=0
+        )
+        history = select(
+            Application.job_id,
+            Application.status,
+            func.lag(Application.status).over(**window).label("previous_status"),
+            stage_rank.label("stage_rank"),
+            case((Application.status == JobStatus.REJECTED.value, 1), else_=0).label("rejected")
+        ).cte("history")
+        
+        furthest = select(
+            func.max(history.c.stage_rank).label("stage_rank"),
+            func.max(history.c.rejected).label("rejected")
+        ).group_by(history.c.job_id).subquery()
+        
+        statement = union_all(
+            select(
+                literal("transition").label("section"),
+                history.c.previous_status.label("key1"),
+                history.c.status.label("key2"),
+                func.count().label("count")
+            ).where(
+                history.c.previous_status.isnot(None),
+                history.c.previous_status != history.c.status
+            ).group_by(history.c.previous_status, history.c.status),
+            select(
+                literal("reach"),
+                cast(furthest.c.stage_rank, String),
+                cast(furthest.c.rejected, String),
+                func.count()
+            ).group_by(furthest.c.stage_rank, furthest.c.rejected)
+        )
+        rows = (await db.execute(statement)).all()
+        
+        transitions = []
+        furthest_counts = defaultdict(int)
+        rejected_counts = defaultdict(int)
+        for section, key1, key2, count in rows:
+            if section == "transition":
+                transitions.append({"from_status": key1, "to_status": key2, "count": count})
+            else:
+                furthest_counts[int(key1)] += count
+                if int(key2):
+                    rejected_counts[int(key1)] += count
+        
+        stages = []
+        reached = sum(furthest_counts.values())
+        previous = None
+        for rank, status in enumerate(PIPELINE_ORDER, start=1):
+            # Jobs whose furthest stage is this one or later
+            reached -= furthest_counts.get(rank - 1, 0)
+            stages.append({
+                "status": status.value,
+                "reached": reached,
+                "rejected": rejected_counts.get(rank, 0),
+                "conversion_rate": round(reached / previous * 100, 2) if previous else None
             })
+            previous = reached
         
-        job_timeline = db.query(
-            func.strftime('%Y-%m', Job.applied_date).label('period'),
-            func.count(Job.id).label('applications'),
-            func.sum(case((Job.current_status == JobStatus.REJECTED.value, 1), else_=0)).label('rejected'),
-            func.sum(case((Job.current_status == JobStatus.OFFER.value, 1), else_=0)).label('offers'),
-            func.sum(case((Job.current_status == JobStatus.HIRED.value, 1), else_=0)).label('hired')
-        ).filter(
-            Job.applied_date >= statistics[0]['month_start_date']
-        ).group_by(func.strftime('%Y-%m', Job.applied_date)).all()
-        
-        interview_timeline = db.query(
-            func.strftime('%Y-%m', Interview.scheduled_date).label('period'),
-            func.count(Interview.id).label('interviews')
-        ).filter(
-            Interview.scheduled_date >= statistics[0]['month_start']
-        ).group_by(func.strftime('%Y-%m', Interview.scheduled_date)).all()
-        
-        job_dict = {getattr(row, 'period', ''): row for row in job_timeline}
-        interview_dict = {getattr(row, 'period', ''): row for row in interview_timeline}
-        
-        for stat in statistics:
-            period = stat['period']
-            job_data = job_dict.get(period)
-            interview_data = interview_dict.get(period)
-            
-            stat['applications'] = getattr(job_data, 'applications', 0) if job_data else 0
-            stat['interviews'] = getattr(interview_data, 'interviews', 0) if interview_data else 0
-            stat['offers'] = getattr(job_data, 'offers', 0) if job_data else 0
-            stat['hired'] = getattr(job_data, 'hired', 0) if job_data else 0
-            stat['rejected'] = getattr(job_data, 'rejected', 0) if job_data else 0
-            
-            del stat['month_start']
-            del stat['month_end']
-            del stat['month_start_date']
-            del stat['month_end_date']
+        transitions.sort(key=lambda t: (-t["count"], t["from_status"], t["to_status"]))
+        return {
+            "total_jobs": sum(furthest_counts.values()),
+            "rejected": sum(rejected_counts.values()),
+            "stages": stages,
+            "transitions": transitions
+        }
+    
+    @staticmethod
+    @analytics_cache.cached
+    async def get_cohorts(
+        db: AsyncSession,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict:
+        """
+        Cohort x stage matrix: for jobs applied in each month, how many reached
+        each pipeline stage after Applied and the average days it took
+        One grouped query - per-job reach over the history, then per month
+        """
+        dialect_name = db.get_bind().dialect.name
+        ranked_stages = list(enumerate(PIPELINE_ORDER, start=1))[1:]
+        stage_rank = case(
+            {status.value: rank for rank, status in enumerate(PIPELINE_ORDER, start=1)},
+            value=Application.status,
+            else_=0
+        )
         
-        return statistics
+        # First time each job was at a stage or a later one (NULL if never)
+        per_job = select(
+            Job.applied_date,
+            *[
+                func.min(case((stage_rank >= rank, Application.status_date))).label(f"reached_{rank}")
+                for rank, _ in ranked_stages
+            ]
+        ).outerjoin(Application, Application.job_id == Job.id).where(Job.applied_date.isnot(None))
+        if start_date:
+            per_job = per_job.where(Job.applied_date >= start_date)
+        if end_date:
+            per_job = per_job.where(Job.applied_date <= end_date)
+        per_job = per_job.group_by(Job.id, Job.applied_date).subquery()
+        
+        cohort = truncate(per_job.c.applied_date, "month", dialect_name)
+        columns = [cohort, func.count()]
+        for rank, _ in ranked_stages:
+            reached = per_job.c[f"reached_{rank}"]
+            columns += [func.count(reached), func.avg(days_between(reached, per_job.c.applied_date, dialect_name))]
+        rows = (await db.execute(select(*columns).group_by(cohort).order_by(cohort))).all()
+        
+        cohorts = []
+        for month, jobs, *values in rows:
+            stages = []
+            for (_, status), reached, average in zip(ranked_stages, values[::2], values[1::2]):
+                stages.append({
+                    "status": status.value,
+                    "reached": reached,
+                    "rate": round(reached / jobs * 100, 2),
+                    "average_days": round(float(average), 1) if average is not None else None
+                })
+            cohorts.append({"cohort": to_date(month).strftime(MONTH_FORMAT), "jobs": jobs, "stages": stages})
+        
+        return {"stages": [status.value for _, status in ranked_stages], "cohorts": cohorts}
     
     @staticmethod
-    def get_complete_analytics(db: Session) -> Dict:
+    @analytics_cache.cached
+    async def get_complete_analytics(db: AsyncSession) -> Dict:
+        """All dashboard sections - the combined rollup query plus the response-time query"""
+        now = datetime.now()
+        rollups = await AnalyticsService.fetch_rollups(db, ALL_SECTIONS, now)
         
         return {
-            "summary": AnalyticsService.get_summary_statistics(db),
-            "by_status": AnalyticsService.get_statistics_by_status(db),
-            "by_source": AnalyticsService.get_statistics_by_source(db),
-            "timeline": AnalyticsService.get_timeline_statistics(db)
+            "summary": AnalyticsService.build_summary(rollups, await AnalyticsService.fetch_response_times(db)),
+            "by_status": AnalyticsService.build_statistics_by_status(rollups),
+            "by_source": AnalyticsService.build_statistics_by_source(rollups),
+            "timeline": AnalyticsService.build_timeline(
+                AnalyticsService.month_rows_to_buckets(rollups[MONTH_STATUS], "month"),
+                AnalyticsService.month_rows_to_buckets(rollups[INTERVIEW_MONTH], "month"),
+                get_buckets("month", None, None, now.date()),
+                "month"
+            )
         }
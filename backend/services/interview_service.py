@@ -1,92 +1,119 @@
 """
 Interview service - Business logic for interview operations
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, or_, case, literal_column, Select
+from sqlalchemy.orm import load_only
+from typing import Optional, List, Tuple
 from datetime import datetime
 from backend.models.interview import Interview
 from backend.models.job import Job
 from backend.schemas.interview import InterviewCreate, InterviewUpdate, InterviewFilter
+from backend.utils.constants import InterviewResult, JobStatus
 
 
 class InterviewService:
     """Service class for interview operations"""
     
     @staticmethod
-    def create_interview(db: Session, interview_data: InterviewCreate) -> Interview:
+    async def create_interview(db: AsyncSession, interview_data: InterviewCreate) -> Interview:
         """
         Create a new interview
         Validates that job_id exists
         """
         # Validate job exists
-        job = db.query(Job).filter(Job.id == interview_data.job_id).first()
+        job = await db.get(Job, interview_data.job_id)
         if not job:
             raise ValueError(f"Job with id {interview_data.job_id} not found")
         
         # Create interview
         interview = Interview(**interview_data.model_dump())
         db.add(interview)
-        db.commit()
-        db.refresh(interview)
+        await db.commit()
+        await db.refresh(interview)
         
         return interview
     
     @staticmethod
-    def get_interview_by_id(db: Session, interview_id: int) -> Optional[Interview]:
+    async def get_interview_by_id(db: AsyncSession, interview_id: int) -> Optional[Interview]:
         """Get interview by ID"""
-        return db.query(Interview).filter(Interview.id == interview_id).first()
+        return await db.get(Interview, interview_id)
     
     @staticmethod
-    def get_interviews(
-        db: Session,
-        filters: Optional[InterviewFilter] = None
-    ) -> tuple[List[Interview], int]:
+    async def get_interview_modified(db: AsyncSession, interview_id: int) -> Optional[Tuple[datetime, int]]:
         """
-        Get interviews with optional filtering
-        Returns (interviews, total_count)
+        Last modification time and row version of an interview, for conditional GET
+        Returns (updated_at, row_version) or None if the interview does not exist
+        """
+        result = await db.execute(
+            select(
+                func.coalesce(Interview.updated_at, Interview.created_at), Interview.row_version
+            ).where(Interview.id == interview_id)
+        )
+        return result.first()
+    
+    @staticmethod
+    def build_interviews_query(filters: Optional[InterviewFilter] = None) -> Select:
+        """
+        Build the filtered interview list query
+        Shared by get_interviews and scripts/check_query_plans.py
         """
-        query = db.query(Interview)
+        query = select(Interview)
         
         if filters:
             # Filter by job_id
             if filters.job_id:
-                query = query.filter(Interview.job_id == filters.job_id)
+                query = query.where(Interview.job_id == filters.job_id)
             
             # Filter by interview_type
             if filters.interview_type:
-                query = query.filter(Interview.interview_type == filters.interview_type)
+                query = query.where(Interview.interview_type == filters.interview_type)
             
             # Filter by result
             if filters.result:
-                query = query.filter(Interview.result == filters.result)
+                query = query.where(Interview.result == filters.result)
             
             # Filter by date range
             if filters.scheduled_date_from:
-                query = query.filter(Interview.scheduled_date >= filters.scheduled_date_from)
+                query = query.where(Interview.scheduled_date >= filters.scheduled_date_from)
             
             if filters.scheduled_date_to:
-                query = query.filter(Interview.scheduled_date <= filters.scheduled_date_to)
-        
-        # Get total count
-        total = query.count()
+                query = query.where(Interview.scheduled_date <= filters.scheduled_date_to)
         
         # Order by scheduled_date descending (upcoming first)
-        interviews = query.order_by(Interview.scheduled_date.desc()).all()
+        return query.order_by(Interview.scheduled_date.desc())
+    
+    @staticmethod
+    async def get_interviews(
+        db: AsyncSession,
+        filters: Optional[InterviewFilter] = None
+    ) -> tuple[List[Interview], int]:
+        """
+        Get interviews with optional filtering
+        The list is not paginated, so the total is the number of rows returned
+        Returns (interviews, total_count)
+        """
+        query = InterviewService.build_interviews_query(filters)
+        if filters and filters.fields:
+            # Only the requested columns are selected (see parse_fields)
+            query = query.options(load_only(*[getattr(Interview, name) for name in filters.fields]))
         
-        return interviews, total
+        interviews = list((await db.scalars(query)).all())
+        return interviews, len(interviews)
     
     @staticmethod
-    def get_interviews_by_job(db: Session, job_id: int) -> List[Interview]:
+    async def get_interviews_by_job(db: AsyncSession, job_id: int) -> List[Interview]:
         """Get all interviews for a specific job"""
-        return db.query(Interview)\
-            .filter(Interview.job_id == job_id)\
-            .order_by(Interview.round_number.asc())\
-            .all()
+        result = await db.scalars(
+            select(Interview)
+            .where(Interview.job_id == job_id)
+            .order_by(Interview.round_number.asc())
+        )
+        return list(result.all())
     
     @staticmethod
-    def get_upcoming_interviews(
-        db: Session, 
+    async def get_upcoming_interviews(
+        db: AsyncSession, 
         days: int = 7
     ) -> List[Interview]:
         """Get upcoming interviews within specified days"""
@@ -95,24 +122,26 @@ class InterviewService:
         now = datetime.now()
         end_date = now + timedelta(days=days)
         
-        return db.query(Interview)\
-            .filter(
+        result = await db.scalars(
+            select(Interview)
+            .where(
                 and_(
                     Interview.scheduled_date >= now,
                     Interview.scheduled_date <= end_date
                 )
-            )\
-            .order_by(Interview.scheduled_date.asc())\
-            .all()
+            )
+            .order_by(Interview.scheduled_date.asc())
+        )
+        return list(result.all())
     
     @staticmethod
-    def update_interview(
-        db: Session, 
+    async def update_interview(
+        db: AsyncSession, 
         interview_id: int, 
         interview_data: InterviewUpdate
     ) -> Optional[Interview]:
         """Update interview"""
-        interview = db.query(Interview).filter(Interview.id == interview_id).first()
+        interview = await db.get(Interview, interview_id)
         if not interview:
             return None
         
@@ -121,13 +150,13 @@ class InterviewService:
         for field, value in update_data.items():
             setattr(interview, field, value)
         
-        db.commit()
-        db.refresh(interview)
+        await db.commit()
+        await db.refresh(interview)
         return interview
     
     @staticmethod
-    def update_interview_result(
-        db: Session,
+    async def update_interview_result(
+        db: AsyncSession,
         interview_id: int,
         result: str,
         feedback: Optional[str] = None
@@ -137,9 +166,9 @@ class InterviewService:
         result should be: Passed, Failed, or Pending
         If result is Failed/Rejected, also update job status to Rejected
         """
-        from backend.models.job import Job
+        from backend.models.application import Application
         
-        interview = db.query(Interview).filter(Interview.id == interview_id).first()
+        interview = await db.get(Interview, interview_id)
         if not interview:
             return None
         
@@ -149,56 +178,61 @@ class InterviewService:
         
         # If interview failed/rejected, update job status to Rejected
         if result in ["Failed", "Rejected"]:
-            job = db.query(Job).filter(Job.id == interview.job_id).first()
-            if job and job.status != "Rejected":
-                job.status = "Rejected"
-        
-        db.commit()
-        db.refresh(interview)
+            job = await db.get(Job, interview.job_id)
+            if job and job.current_status != JobStatus.REJECTED.value:
+                job.current_status = JobStatus.REJECTED.value
+                db.add(Application(
+                    job_id=job.id,
+                    status=job.current_status,
+                    notes=f"Interview round {interview.round_number}: {result}",
+                    status_date=datetime.now()
+                ))
+        
+        await db.commit()
+        await db.refresh(interview)
         return interview
     
     @staticmethod
-    def delete_interview(db: Session, interview_id: int) -> bool:
+    async def delete_interview(db: AsyncSession, interview_id: int) -> bool:
         """Delete interview"""
-        interview = db.query(Interview).filter(Interview.id == interview_id).first()
+        interview = await db.get(Interview, interview_id)
         if not interview:
             return False
         
-        db.delete(interview)
-        db.commit()
+        await db.delete(interview)
+        await db.commit()
         return True
     
     @staticmethod
-    def get_interview_stats(db: Session, job_id: Optional[int] = None) -> dict:
+    async def get_interview_stats(db: AsyncSession, job_id: Optional[int] = None) -> dict:
         """
-        Get interview statistics
+        Get interview statistics - one grouped aggregate query
         If job_id provided, stats for that job only
         """
-        query = db.query(Interview)
+        # Inline 'Other' so SELECT and GROUP BY are the same expression on PostgreSQL
+        interview_type = func.coalesce(func.nullif(Interview.interview_type, ""), literal_column("'Other'"))
+        query = select(
+            interview_type,
+            func.count(),
+            func.sum(case((Interview.result == InterviewResult.PASSED.value, 1), else_=0)),
+            # Count both "Failed" and "Rejected" as failed
+            func.sum(case((Interview.result.in_([InterviewResult.FAILED.value, "Rejected"]), 1), else_=0)),
+            func.sum(case(
+                (or_(Interview.result == InterviewResult.PENDING.value, Interview.result.is_(None)), 1),
+                else_=0
+            ))
+        ).group_by(interview_type).order_by(interview_type)
         
         if job_id:
-            query = query.filter(Interview.job_id == job_id)
-        
-        interviews = query.all()
-        
-        # Debug: print all result values
-        print(f"DEBUG: Total interviews: {len(interviews)}")
-        result_values = [i.result for i in interviews]
-        print(f"DEBUG: All result values: {result_values}")
-        
-        total = len(interviews)
-        passed = sum(1 for i in interviews if i.result == "Passed")
-        # Count both "Failed" and "Rejected" as failed
-        failed = sum(1 for i in interviews if i.result in ["Failed", "Rejected"])
-        pending = sum(1 for i in interviews if i.result == "Pending" or i.result is None)
-        
-        print(f"DEBUG: passed={passed}, failed={failed}, pending={pending}")
-        
-        # Count by type
-        by_type = {}
-        for interview in interviews:
-            itype = interview.interview_type or "Other"
-            by_type[itype] = by_type.get(itype, 0) + 1
+            query = query.where(Interview.job_id == job_id)
+        
+        # One row per interview type - totals are summed from those few rows
+        rows = (await db.execute(query)).all()
+        by_type = {itype: count for itype, count, _, _, _ in rows}
+        total = sum(by_type.values())
+        passed = sum(row[2] for row in rows)
+        failed = sum(row[3] for row in rows)
+        pending = sum(row[4] for row in rows)
         
         return {
             "total": total,
@@ -1,28 +1,43 @@
 """
 Job service - Business logic for job operations
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
-from typing import Optional, List
-from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, func, or_, and_, true, false, tuple_, literal, String, Select
+from sqlalchemy.orm import load_only
+from typing import Dict, Optional, List, Tuple
+from datetime import date, datetime
 from backend.models.job import Job
 from backend.models.application import Application
-from backend.schemas.job import JobCreate, JobUpdate, JobFilter
-from backend.utils.constants import JobStatus
+from backend.schemas.job import JobCreate, JobUpdate, JobFilter, JobStatusChange
+from backend.core.fulltext import tokenize, get_fulltext_backend
+from backend.utils.constants import JobStatus, CountMode
+from backend.utils.pagination import (
+    encode_cursor,
+    decode_cursor,
+    sqlite_datetime_text,
+    with_total_count,
+    estimate_count,
+    TOTAL_COUNT_LABEL
+)
+
+# Non-nullable sort columns that support keyset (cursor) pagination
+KEYSET_SORT_COLUMNS = {
+    "applied_date", "created_at", "updated_at", "company_name", "job_title", "current_status", "id"
+}
 
 
 class JobService:
     """Service class for job operations"""
     
     @staticmethod
-    def create_job(db: Session, job_data: JobCreate) -> Job:
+    async def create_job(db: AsyncSession, job_data: JobCreate) -> Job:
         """
         Create a new job and add initial application status
         """
         # Create job
         job = Job(**job_data.model_dump())
         db.add(job)
-        db.flush()  # Get job.id without committing
+        await db.flush()  # Get job.id without committing
         
         # Create initial application record
         initial_application = Application(
@@ -32,103 +47,283 @@ class JobService:
             status_date=job.applied_date
         )
         db.add(initial_application)
-        db.commit()
-        db.refresh(job)
+        await db.commit()
+        await db.refresh(job)
         
         return job
     
     @staticmethod
-    def get_job_by_id(db: Session, job_id: int) -> Optional[Job]:
+    async def bulk_create_jobs(db: AsyncSession, items: List[JobCreate]) -> List[Job]:
+        """
+        Create many jobs and their initial application records in one transaction
+        Jobs go through the unit of work so the folded search columns and rollups
+        stay in sync; it batches them as INSERT ... RETURNING (insertmanyvalues),
+        fetching ids and server defaults without a per-job refresh
+        History rows need nothing back and are written with one executemany
+        """
+        jobs = [Job(**item.model_dump()) for item in items]
+        db.add_all(jobs)
+        await db.flush()  # ids for the history rows
+        
+        await db.execute(insert(Application), [
+            {
+                "job_id": job.id,
+                "status": job.current_status,
+                "notes": "Initial application submitted",
+                "status_date": job.applied_date
+            }
+            for job in jobs
+        ])
+        await db.commit()
+        
+        return jobs
+    
+    @staticmethod
+    async def get_job_by_id(db: AsyncSession, job_id: int) -> Optional[Job]:
         """Get job by ID"""
-        return db.query(Job).filter(Job.id == job_id).first()
+        return await db.get(Job, job_id)
     
     @staticmethod
-    def get_jobs(
-        db: Session,
-        filters: JobFilter
-    ) -> tuple[List[Job], int]:
+    async def get_job_modified(db: AsyncSession, job_id: int) -> Optional[Tuple[datetime, int]]:
         """
-        Get jobs with filtering, sorting, and pagination
-        Returns (jobs, total_count)
+        Last modification time and row version of a job - primary key lookup,
+        for conditional GET; returns (updated_at, row_version) or None if the
+        job is missing
         """
-        query = db.query(Job)
+        result = await db.execute(
+            select(func.coalesce(Job.updated_at, Job.created_at), Job.row_version).where(Job.id == job_id)
+        )
+        return result.first()
+    
+    @staticmethod
+    def build_jobs_query(filters: JobFilter, dialect_name: str) -> Select:
+        """
+        Build the filtered and sorted job list query (without pagination)
+        Shared by get_jobs and scripts/check_query_plans.py
+        Text filters are accent-insensitive substring matches on the *_folded
+        shadow columns, served by the dialect's trigram index
+        """
+        contains = get_fulltext_backend(dialect_name).folded_contains
+        query = select(Job)
         
         # Apply filters
         # Handle multi-field search with OR condition
         if filters.company_name and filters.job_title and filters.location:
             # All three are the same - search in company, job title, OR location
             if filters.company_name == filters.job_title == filters.location:
-                query = query.filter(
+                query = query.where(
                     or_(
-                        Job.company_name.ilike(f"%{filters.company_name}%"),
-                        Job.job_title.ilike(f"%{filters.job_title}%"),
-                        Job.location.ilike(f"%{filters.location}%")
+                        contains("company_name", filters.company_name),
+                        contains("job_title", filters.job_title),
+                        contains("location", filters.location)
                     )
                 )
             else:
                 # Different values, use AND for each field
-                query = query.filter(Job.company_name.ilike(f"%{filters.company_name}%"))
-                query = query.filter(Job.job_title.ilike(f"%{filters.job_title}%"))
-                query = query.filter(Job.location.ilike(f"%{filters.location}%"))
+                query = query.where(contains("company_name", filters.company_name))
+                query = query.where(contains("job_title", filters.job_title))
+                query = query.where(contains("location", filters.location))
         elif filters.company_name and filters.job_title:
             # If both are the same (search in both fields), use OR
             if filters.company_name == filters.job_title:
-                query = query.filter(
+                query = query.where(
                     or_(
-                        Job.company_name.ilike(f"%{filters.company_name}%"),
-                        Job.job_title.ilike(f"%{filters.job_title}%")
+                        contains("company_name", filters.company_name),
+                        contains("job_title", filters.job_title)
                     )
                 )
             else:
                 # Different values, use AND
-                query = query.filter(Job.company_name.ilike(f"%{filters.company_name}%"))
-                query = query.filter(Job.job_title.ilike(f"%{filters.job_title}%"))
+                query = query.where(contains("company_name", filters.company_name))
+                query = query.where(contains("job_title", filters.job_title))
         elif filters.company_name:
-            query = query.filter(Job.company_name.ilike(f"%{filters.company_name}%"))
+            query = query.where(contains("company_name", filters.company_name))
         elif filters.job_title:
-            query = query.filter(Job.job_title.ilike(f"%{filters.job_title}%"))
+            query = query.where(contains("job_title", filters.job_title))
         
         if filters.status:
-            query = query.filter(Job.current_status == filters.status)
+            query = query.where(Job.current_status == filters.status)
         
         if filters.source:
-            query = query.filter(Job.source.ilike(f"%{filters.source}%"))
+            query = query.where(Job.source.ilike(f"%{filters.source}%"))
         
         if filters.location:
-            query = query.filter(Job.location.ilike(f"%{filters.location}%"))
+            query = query.where(contains("location", filters.location))
         
         if filters.work_type:
-            query = query.filter(Job.work_type == filters.work_type)
+            query = query.where(Job.work_type == filters.work_type)
         
         if filters.is_favorite is not None:
-            query = query.filter(Job.is_favorite == filters.is_favorite)
+            # Literal true/false so the planner can match the partial favorites index
+            query = query.where(Job.is_favorite == (true() if filters.is_favorite else false()))
         
         if filters.applied_date_from:
-            query = query.filter(Job.applied_date >= filters.applied_date_from)
+            query = query.where(Job.applied_date >= filters.applied_date_from)
         
         if filters.applied_date_to:
-            query = query.filter(Job.applied_date <= filters.applied_date_to)
+            query = query.where(Job.applied_date <= filters.applied_date_to)
         
-        # Get total count before pagination
-        total = query.count()
-        
-        # Apply sorting
+        return JobService.order_jobs_query(query, filters)
+    
+    @staticmethod
+    def sort_keys(filters: JobFilter) -> list:
+        """ORDER BY terms of the job list (id breaks ties so pages never skip or repeat rows)"""
         sort_column = getattr(Job, filters.sort_by, Job.applied_date)
+        order_columns = [sort_column] if filters.sort_by == "id" else [sort_column, Job.id]
         if filters.sort_order == "desc":
-            query = query.order_by(sort_column.desc())
+            return [column.desc() for column in order_columns]
+        return [column.asc() for column in order_columns]
+    
+    @staticmethod
+    def order_jobs_query(query: Select, filters: JobFilter) -> Select:
+        """Apply sorting"""
+        return query.order_by(*JobService.sort_keys(filters))
+    
+    @staticmethod
+    def load_columns(filters: JobFilter) -> List[str]:
+        """
+        Columns to load for a sparse fieldset: the requested ones plus id,
+        updated_at and row_version (page_validator) and the sort column of
+        the next cursor
+        """
+        sort_column = getattr(Job, filters.sort_by, Job.applied_date)
+        return list(dict.fromkeys((*filters.fields, "id", "updated_at", "row_version", sort_column.key)))
+    
+    @staticmethod
+    def apply_cursor(query: Select, filters: JobFilter, dialect_name: str) -> Select:
+        """
+        Add the keyset seek predicate for filters.cursor:
+        (sort_column, id) strictly after the cursor row in the requested order
+        """
+        cursor = decode_cursor(filters.cursor)
+        if cursor["sort_by"] != filters.sort_by or cursor["sort_order"] != filters.sort_order:
+            raise ValueError("Cursor does not match sort_by/sort_order")
+        if filters.sort_by not in KEYSET_SORT_COLUMNS:
+            raise ValueError(f"Cursor pagination is not supported when sorting by {filters.sort_by}")
+        
+        sort_column = getattr(Job, filters.sort_by)
+        value = cursor["value"]
+        python_type = sort_column.type.python_type
+        if value is not None and python_type in (date, datetime):
+            value = python_type.fromisoformat(value)
+            if python_type is datetime and dialect_name == "sqlite":
+                # SQLite compares the stored text - bind the value the same way
+                value = literal(sqlite_datetime_text(value), String)
+        
+        if filters.sort_by == "id":
+            left, right = Job.id, cursor["id"]
         else:
-            query = query.order_by(sort_column.asc())
+            left, right = tuple_(sort_column, Job.id), tuple_(value, cursor["id"])
         
-        # Apply pagination
-        offset = (filters.page - 1) * filters.page_size
-        jobs = query.offset(offset).limit(filters.page_size).all()
+        if filters.sort_order == "desc":
+            return query.where(left < right)
+        return query.where(left > right)
+    
+    @staticmethod
+    def build_page_query(filters: JobFilter, dialect_name: str, count_in_query: bool) -> Select:
+        """
+        The statement get_jobs runs for one page: the filtered query plus the
+        filtered total (count_in_query), the sparse fieldset and the
+        cursor seek or offset, limited to page_size + 1 rows
+        Shared by get_jobs and scripts/check_query_plans.py
+        """
+        query = JobService.build_jobs_query(filters, dialect_name)
+        if count_in_query and filters.cursor:
+            # The total covers the whole filtered set, not only the rows after
+            # the cursor - an uncorrelated scalar subquery, evaluated once per
+            # statement (so every counted cursor page recounts the set)
+            total_count = select(func.count()).select_from(query.order_by(None).subquery())
+            query = query.add_columns(total_count.scalar_subquery().label(TOTAL_COUNT_LABEL))
+        elif count_in_query:
+            # Window ordered like the page: read in index order, no extra sort
+            query = with_total_count(query, order_by=JobService.sort_keys(filters))
         
-        return jobs, total
+        if filters.fields:
+            # Skip unrequested columns (job_description, contacts...) in SQL
+            columns = JobService.load_columns(filters)
+            query = query.options(load_only(*[getattr(Job, name) for name in columns]))
+        
+        # Apply pagination - fetch one extra row to know whether a next page exists
+        if filters.cursor:
+            query = JobService.apply_cursor(query, filters, dialect_name)
+        else:
+            query = query.offset((filters.page - 1) * filters.page_size)
+        return query.limit(filters.page_size + 1)
+    
+    @staticmethod
+    async def get_jobs(
+        db: AsyncSession,
+        filters: JobFilter
+    ) -> tuple[List[Job], Optional[int], Optional[str]]:
+        """
+        Get jobs with filtering, sorting, and pagination
+        Pages by filters.cursor (keyset) when given, otherwise by page/offset
+        The total comes from the page query itself (filters.count == exact),
+        a planner estimate (estimate) or is skipped (none); an exact total
+        costs a count of the whole filtered set on every page, cursor pages
+        included
+        Returns (jobs, total_count, next_cursor)
+        """
+        dialect_name = db.get_bind().dialect.name
+        filtered = JobService.build_jobs_query(filters, dialect_name)
+        
+        total = None
+        if filters.count == CountMode.ESTIMATE:
+            total = await estimate_count(db, filtered)
+        # Databases without planner estimates fall back to the exact window count
+        count_in_query = filters.count == CountMode.EXACT or (
+            filters.count == CountMode.ESTIMATE and total is None
+        )
+        result = await db.execute(JobService.build_page_query(filters, dialect_name, count_in_query))
+        
+        if count_in_query:
+            rows = result.all()
+            jobs = [row[0] for row in rows]
+            if rows:
+                total = rows[0][1]
+            elif filters.cursor or filters.page > 1:
+                # Past the last row there is no row to carry the window value
+                total = await db.scalar(
+                    select(func.count()).select_from(filtered.order_by(None).subquery())
+                )
+            else:
+                total = 0
+        else:
+            jobs = list(result.scalars().all())
+        
+        next_cursor = None
+        if len(jobs) > filters.page_size:
+            jobs = jobs[:filters.page_size]
+            if filters.sort_by in KEYSET_SORT_COLUMNS:
+                last = jobs[-1]
+                next_cursor = encode_cursor(
+                    filters.sort_by, filters.sort_order, getattr(last, filters.sort_by), last.id
+                )
+        
+        return jobs, total, next_cursor
     
     @staticmethod
-    def update_job(db: Session, job_id: int, job_data: JobUpdate) -> Optional[Job]:
+    def page_validator(jobs: List[Job], total: Optional[int], next_cursor: Optional[str]) -> Tuple:
+        """
+        What a list page's ETag is built from: the page's row ids and row
+        versions, the total and the next cursor - all database state
+        """
+        return tuple((job.id, job.row_version) for job in jobs), total, next_cursor
+    
+    @staticmethod
+    async def get_jobs_validator(db: AsyncSession, filters: JobFilter) -> Tuple:
+        """
+        page_validator of the requested page without loading its wide columns
+        (the page query narrowed to id, row_version and the sort column)
+        Only for conditional requests, to answer 304 before the full page
+        """
+        narrow = filters.model_copy(update={"fields": ("row_version",)})
+        return JobService.page_validator(*await JobService.get_jobs(db, narrow))
+    
+    @staticmethod
+    async def update_job(db: AsyncSession, job_id: int, job_data: JobUpdate) -> Optional[Job]:
         """Update job"""
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = await db.get(Job, job_id)
         if not job:
             return None
         
@@ -137,13 +332,13 @@ class JobService:
         for field, value in update_data.items():
             setattr(job, field, value)
         
-        db.commit()
-        db.refresh(job)
+        await db.commit()
+        await db.refresh(job)
         return job
     
     @staticmethod
-    def update_job_status(
-        db: Session,
+    async def update_job_status(
+        db: AsyncSession,
         job_id: int,
         new_status: str,
         notes: Optional[str] = None
@@ -151,7 +346,7 @@ class JobService:
         """
         Update job status and create application history record
         """
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = await db.get(Job, job_id)
         if not job:
             return None
         
@@ -168,29 +363,75 @@ class JobService:
         )
         db.add(application)
         
-        db.commit()
-        db.refresh(job)
+        await db.commit()
+        await db.refresh(job)
         return job
     
     @staticmethod
-    def delete_job(db: Session, job_id: int) -> bool:
+    async def bulk_update_job_status(db: AsyncSession, items: List[JobStatusChange]) -> Dict[int, Job]:
+        """
+        Apply many status transitions with their history records in one transaction
+        One SELECT loads every job, history rows go in one executemany INSERT,
+        the flush batches the job UPDATEs (keeping the rollups in sync) and one
+        SELECT after commit reloads updated_at
+        Returns the updated jobs by id - ids missing from the result were not found
+        """
+        job_ids = [item.job_id for item in items]
+        result = await db.scalars(select(Job).where(Job.id.in_(job_ids)))
+        jobs = {job.id: job for job in result.all()}
+        if not jobs:
+            return jobs
+        
+        status_date = datetime.now()
+        history = []
+        for item in items:
+            job = jobs.get(item.job_id)
+            if job is None:
+                continue
+            job.current_status = item.new_status.value
+            history.append({
+                "job_id": job.id,
+                "status": item.new_status.value,
+                "notes": item.notes,
+                "status_date": status_date
+            })
+        
+        await db.execute(insert(Application), history)
+        await db.commit()
+        
+        # updated_at is set by the database on UPDATE - reload it for all jobs at once
+        await db.execute(
+            select(Job).where(Job.id.in_(list(jobs))).execution_options(populate_existing=True)
+        )
+        return jobs
+    
+    @staticmethod
+    async def delete_job(db: AsyncSession, job_id: int) -> bool:
         """Delete job (cascade deletes applications, interviews, notes)"""
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = await db.get(Job, job_id)
         if not job:
             return False
         
-        db.delete(job)
-        db.commit()
+        await db.delete(job)
+        await db.commit()
         return True
     
     @staticmethod
-    def search_jobs(db: Session, keyword: str, limit: int = 20) -> List[Job]:
+    async def search_jobs(
+        db: AsyncSession,
+        keyword: str,
+        limit: int = 20,
+        ranked: bool = True
+    ) -> List[Job]:
         """
-        Search jobs by keyword (company name or job title)
+        Full-text search over company name, job title, location and description
+        Every word must match (as a prefix); ranked=True orders by relevance,
+        otherwise by applied_date (newest first)
         """
-        return db.query(Job).filter(
-            or_(
-                Job.company_name.ilike(f"%{keyword}%"),
-                Job.job_title.ilike(f"%{keyword}%")
-            )
-        ).limit(limit).all()
+        terms = tokenize(keyword)
+        if not terms:
+            return []
+        
+        backend = get_fulltext_backend(db.get_bind().dialect.name)
+        result = await db.scalars(backend.search_query(terms, ranked).limit(limit))
+        return list(result.all())
@@ -0,0 +1,124 @@
+"""
+Salary service - salary distributions normalized to one currency
+Salary columns are bulk-loaded as plain rows and converted with one
+vectorized multiply by the FX rate column, not per-row Decimal arithmetic
+"""
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, or_
+from backend.core.config import settings
+from backend.models.job import Job
+from backend.services.analytics_service import analytics_cache
+
+SALARY_COLUMNS = ["salary_min", "salary_max", "salary_currency", "source", "location", "work_type"]
+
+GROUP_COLUMNS = ("source", "location", "work_type")
+
+# Currency assumed for rows without one (the column default)
+DEFAULT_CURRENCY = "VND"
+
+QUANTILES = {"p25": 0.25, "median": 0.5, "p75": 0.75, "p90": 0.9}
+
+
+class SalaryService:
+    
+    @staticmethod
+    async def load_salaries(db: AsyncSession) -> pd.DataFrame:
+        """Salary and grouping columns of every job with a salary"""
+        statement = select(
+            Job.salary_min, Job.salary_max, Job.salary_currency,
+            Job.source, Job.location, Job.work_type
+        ).where(or_(Job.salary_min.isnot(None), Job.salary_max.isnot(None)))
+        result = await db.execute(statement)
+        return pd.DataFrame(result.all(), columns=SALARY_COLUMNS)
+    
+    @staticmethod
+    def normalize(frame: pd.DataFrame, rates: Dict[str, float], target_rate: float) -> pd.DataFrame:
+        """
+        Add a `salary` column: midpoint of min/max (or whichever is set) in the
+        target currency; rows in a currency missing from rates get NaN
+        """
+        currency = frame["salary_currency"].fillna(DEFAULT_CURRENCY).str.upper()
+        factor = currency.map(rates).to_numpy(dtype=float) / target_rate
+        amounts = frame[["salary_min", "salary_max"]].to_numpy(dtype=float, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            midpoint = np.nanmean(amounts, axis=1) if len(amounts) else np.empty(0)
+        return frame.assign(salary=midpoint * factor)
+    
+    @staticmethod
+    def describe(salaries: pd.Series) -> Dict:
+        """Count, mean, min/max and quantiles of one salary series"""
+        if salaries.empty:
+            return {"count": 0, "mean": None, "min": None, "max": None, **{name: None for name in QUANTILES}}
+        quantiles = salaries.quantile(list(QUANTILES.values())).to_numpy()
+        return {
+            "count": int(salaries.size),
+            "mean": round(float(salaries.mean()), 2),
+            "min": round(float(salaries.min()), 2),
+            "max": round(float(salaries.max()), 2),
+            **{name: round(float(value), 2) for name, value in zip(QUANTILES, quantiles)}
+        }
+    
+    @staticmethod
+    def group_table(frame: pd.DataFrame, column: str) -> List[Dict]:
+        """Salary statistics per value of one grouping column, largest groups first"""
+        grouped = frame.dropna(subset=[column]).groupby(column)["salary"]
+        table = grouped.agg(["count", "mean", "min", "max"])
+        quantiles = grouped.quantile(list(QUANTILES.values())).unstack()
+        for name, q in QUANTILES.items():
+            table[name] = quantiles[q] if len(quantiles) else np.nan
+        table = table.sort_values("count", ascending=False, kind="stable")
+        
+        records = table.round(2).reset_index().rename(columns={column: "key"}).to_dict(orient="records")
+        for record in records:
+            record["count"] = int(record["count"])
+        return records
+    
+    @staticmethod
+    def histogram(salaries: pd.Series, bins: int) -> List[Dict]:
+        """Equal-width bins between the smallest and largest salary"""
+        if salaries.empty:
+            return []
+        counts, edges = np.histogram(salaries.to_numpy(), bins=bins)
+        return [
+            {"start": round(float(start), 2), "end": round(float(end), 2), "count": int(count)}
+            for start, end, count in zip(edges[:-1], edges[1:], counts)
+        ]
+    
+    @staticmethod
+    def compute_salary_statistics(
+        frame: pd.DataFrame,
+        currency: str,
+        rates: Dict[str, float],
+        bins: int
+    ) -> Dict:
+        """Overall, per-group and histogram statistics in `currency`"""
+        rates = {code.upper(): rate for code, rate in rates.items()}
+        frame = SalaryService.normalize(frame, rates, rates[currency])
+        valid = frame[frame["salary"].notna()]
+        
+        return {
+            "currency": currency,
+            "fx_rates": {code: rate / rates[currency] for code, rate in sorted(rates.items())},
+            "skipped": int(len(frame) - len(valid)),
+            "overall": SalaryService.describe(valid["salary"]),
+            "histogram": SalaryService.histogram(valid["salary"], bins),
+            **{f"by_{column}": SalaryService.group_table(valid, column) for column in GROUP_COLUMNS}
+        }
+    
+    @staticmethod
+    @analytics_cache.cached
+    async def get_salary_statistics(db: AsyncSession, currency: Optional[str] = None, bins: int = 10) -> Dict:
+        """
+        Salary analytics normalized to `currency` (default SALARY_BASE_CURRENCY)
+        Raises ValueError for a currency missing from the FX table
+        """
+        currency = (currency or settings.SALARY_BASE_CURRENCY).upper()
+        rates = {code.upper(): rate for code, rate in settings.FX_RATES.items()}
+        if currency not in rates:
+            raise ValueError(f"No FX rate configured for {currency}; known: {', '.join(sorted(rates))}")
+        
+        frame = await SalaryService.load_salaries(db)
+        return SalaryService.compute_salary_statistics(frame, currency, rates, bins)
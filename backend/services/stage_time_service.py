@@ -0,0 +1,112 @@
+"""
+Stage time service - time-in-stage (dwell time) distributions
+History rows are loaded as plain columns (no ORM objects) and processed as
+sorted NumPy arrays, so the cost is a few vector passes rather than a Python
+loop per job
+"""
+from typing import Dict, List, Sequence
+import numpy as np
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from backend.models.job import Job
+from backend.models.application import Application
+from backend.services.analytics_service import analytics_cache
+
+PERCENTILES = (50, 75, 90)
+
+NANOSECONDS_PER_DAY = 86_400 * 10**9
+
+HISTORY_COLUMNS = ["job_id", "status", "status_date", "source"]
+
+
+class StageTimeService:
+    
+    @staticmethod
+    async def load_history(db: AsyncSession) -> pd.DataFrame:
+        """
+        (job_id, status, status_date, source) for every history row, sorted by
+        job then time - read in ix_applications_job_history order
+        """
+        statement = select(
+            Application.job_id, Application.status, Application.status_date, Job.source
+        ).join(Job, Job.id == Application.job_id).order_by(
+            Application.job_id, Application.status_date, Application.id
+        )
+        result = await db.execute(statement)
+        return pd.DataFrame(result.all(), columns=HISTORY_COLUMNS)
+    
+    @staticmethod
+    def compute_stays(history: pd.DataFrame) -> pd.DataFrame:
+        """
+        One row per stay in a stage: (status, source, days, finished)
+        history must be sorted by job_id, status_date. Consecutive rows with
+        the same status are one stay; a stay ends when the next stay of the
+        same job starts, the last stay of each job is still open
+        """
+        job_ids = history["job_id"].to_numpy()
+        statuses = history["status"].to_numpy()
+        timestamps = (
+            pd.to_datetime(history["status_date"], utc=True)
+            .dt.tz_convert(None)
+            .to_numpy(dtype="datetime64[ns]")
+            .view("int64")
+        )
+        
+        # Stay boundaries: first row of a job or a status change
+        starts = np.ones(len(history), dtype=bool)
+        starts[1:] = (job_ids[1:] != job_ids[:-1]) | (statuses[1:] != statuses[:-1])
+        index = np.flatnonzero(starts)
+        
+        stay_jobs = job_ids[index]
+        stay_times = timestamps[index]
+        finished = np.zeros(len(index), dtype=bool)
+        finished[:-1] = stay_jobs[1:] == stay_jobs[:-1]
+        days = np.full(len(index), np.nan)
+        days[:-1] = np.diff(stay_times) / NANOSECONDS_PER_DAY
+        days[~finished] = np.nan
+        
+        return pd.DataFrame({
+            "status": statuses[index],
+            "source": history["source"].to_numpy()[index],
+            "days": days,
+            "finished": finished
+        })
+    
+    @staticmethod
+    def percentile_table(stays: pd.DataFrame, keys: Sequence[str]) -> List[Dict]:
+        """Count, mean and percentiles of finished stays (plus open stays) per key"""
+        grouped = stays.groupby(list(keys), sort=True)
+        days = stays[stays["finished"]].groupby(list(keys))["days"]
+        table = pd.DataFrame({
+            "count": days.count(),
+            "in_stage": grouped["finished"].size() - grouped["finished"].sum(),
+            "mean_days": days.mean()
+        })
+        quantiles = days.quantile([p / 100 for p in PERCENTILES]).unstack()
+        for p in PERCENTILES:
+            table[f"p{p}_days"] = quantiles[p / 100] if len(quantiles) else np.nan
+        
+        table["count"] = table["count"].fillna(0).astype(int)
+        table = table.round(1).astype(object).where(table.notna(), None)
+        return table.reset_index().to_dict(orient="records")
+    
+    @staticmethod
+    def compute_time_in_stage(history: pd.DataFrame) -> Dict:
+        """Per-status and per-source x status dwell-time tables"""
+        if history.empty:
+            return {"percentiles": list(PERCENTILES), "by_status": [], "by_source": []}
+        
+        stays = StageTimeService.compute_stays(history)
+        return {
+            "percentiles": list(PERCENTILES),
+            "by_status": StageTimeService.percentile_table(stays, ["status"]),
+            "by_source": StageTimeService.percentile_table(stays.dropna(subset=["source"]), ["source", "status"])
+        }
+    
+    @staticmethod
+    @analytics_cache.cached
+    async def get_time_in_stage(db: AsyncSession) -> Dict:
+        """Time-in-stage percentiles from the full status history"""
+        history = await StageTimeService.load_history(db)
+        return StageTimeService.compute_time_in_stage(history)
@@ -78,6 +78,13 @@ class JobSource(str, Enum):
     OTHER = "Other"
 
 
+class CountMode(str, Enum):
+    """How list endpoints compute the total row count"""
+    EXACT = "exact"        # COUNT(*) OVER () in the page query
+    ESTIMATE = "estimate"  # planner estimate where the database has one
+    NONE = "none"          # skip counting (total is null)
+
+
 # Pipeline status order (for analytics)
 PIPELINE_ORDER = [
     JobStatus.APPLIED,
@@ -0,0 +1,88 @@
+"""
+Keyset (cursor) pagination helpers
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Sequence
+from sqlalchemy import func, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TOTAL_COUNT_LABEL = "total_count"
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, row_id: int) -> str:
+    """
+    Build an opaque cursor pointing just after (value, row_id)
+    Dates are stored as ISO strings and restored by decode_cursor's caller
+    """
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    payload = {"s": sort_by, "o": sort_order, "v": value, "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by encode_cursor (raises ValueError if malformed)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            "sort_by": payload["s"],
+            "sort_order": payload["o"],
+            "value": payload["v"],
+            "id": int(payload["id"])
+        }
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def sqlite_datetime_text(value: datetime) -> str:
+    """
+    A datetime as SQLite stores it: CURRENT_TIMESTAMP defaults are whole
+    seconds ('YYYY-MM-DD HH:MM:SS'), values written by SQLAlchemy carry
+    microseconds - the text forms sort in time order, but only when a bound
+    value uses the same form as the stored one
+    """
+    if value.microsecond:
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def with_total_count(query: Select, order_by: Sequence = ()) -> Select:
+    """
+    Add a COUNT(*) OVER () column so the page rows and the filtered total
+    come back from one statement (the window is evaluated before LIMIT/OFFSET)
+    order_by (the query's own ORDER BY) orders the window over the whole
+    frame - same count, read in index order without a separate sort; the
+    window still buffers the whole filtered set before the first row
+    """
+    if order_by:
+        window = func.count().over(order_by=list(order_by), rows=(None, None))
+    else:
+        window = func.count().over()
+    return query.add_columns(window.label(TOTAL_COUNT_LABEL))
+
+
+async def estimate_count(db: AsyncSession, query: Select) -> Optional[int]:
+    """
+    Planner row estimate for a query - nothing is executed
+    Returns None on databases without planner statistics (SQLite)
+    """
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        return None
+    
+    compiled = query.order_by(None).compile(dialect=dialect)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    
+    connection = await db.connection()
+    plan = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    plan = plan.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
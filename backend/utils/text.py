@@ -0,0 +1,22 @@
+"""
+Text normalization helpers
+"""
+import re
+import unicodedata
+from typing import Optional
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def fold_text(value: Optional[str]) -> Optional[str]:
+    """
+    Lowercase and strip diacritics for accent-insensitive matching
+    "Hà Nội" -> "ha noi", "Đà Nẵng" -> "da nang"
+    """
+    if value is None:
+        return None
+    # đ/Đ is a separate letter, not d + combining mark, so NFKD keeps it
+    value = value.replace("đ", "d").replace("Đ", "D")
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return WHITESPACE_PATTERN.sub(" ", stripped).strip().lower()
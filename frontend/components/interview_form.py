@@ -268,7 +268,7 @@ def render_interview_form(
         
         # Get jobs for dropdown
         try:
-            jobs_response = job_service.get_jobs(page_size=100)
+            jobs_response = job_service.get_jobs(page_size=100, fields=["company_name", "job_title"])
             jobs = jobs_response.get("items", [])
             job_options = {f"{j['company_name']} - {j['job_title']}": j['id'] for j in jobs}
         except:
@@ -17,6 +17,12 @@ STATUS_VN_MAP = {
     "Rejected": "Bị từ chối"
 }
 
+# Columns the cards display - the list skips job_description, contacts, URLs
+JOB_CARD_FIELDS = [
+    "company_name", "job_title", "location", "current_status", "applied_date",
+    "salary_min", "salary_max", "salary_currency", "source", "is_favorite"
+]
+
 
 def render_job_list(filters: dict):
     """
@@ -32,14 +38,33 @@ def render_job_list(filters: dict):
         if 'jobs_page_size' not in st.session_state:
             st.session_state.jobs_page_size = 10
         
-        # Get jobs with pagination
+        # Keyset cursors per page for the current filters (reset when they change)
+        cursor_key = (repr(sorted((filters or {}).items())), st.session_state.jobs_page_size)
+        if st.session_state.get('jobs_cursor_key') != cursor_key:
+            st.session_state.jobs_cursor_key = cursor_key
+            st.session_state.jobs_page_cursors = {}
+            st.session_state.jobs_total = None
+        cursor = st.session_state.jobs_page_cursors.get(st.session_state.jobs_page)
+        
+        # Cursor pages reuse the total counted earlier for the same filters
+        known_total = st.session_state.jobs_total if cursor else None
+        
+        # Get jobs with pagination (cursor when known, page offset otherwise)
         response = job_service.get_jobs(
             page=st.session_state.jobs_page, 
             page_size=st.session_state.jobs_page_size, 
-            filters=filters
+            filters=filters,
+            cursor=cursor,
+            count="none" if known_total is not None else None,
+            fields=JOB_CARD_FIELDS
         )
+        if response.get("next_cursor"):
+            st.session_state.jobs_page_cursors[st.session_state.jobs_page + 1] = response["next_cursor"]
         jobs = response.get("items", [])
-        total = response.get("total", 0)
+        total = response.get("total")
+        if total is None:
+            total = known_total or 0
+        st.session_state.jobs_total = total
         total_pages = (total + st.session_state.jobs_page_size - 1) // st.session_state.jobs_page_size
         
         # Custom CSS for buttons
@@ -93,6 +93,12 @@ try:
     by_source = analytics.get("by_source", [])
     timeline = analytics.get("timeline", [])
     
+    # Stage reach from the status history (a job rejected after an interview
+    # still counts as having reached Interview)
+    funnel = analytics_service.get_funnel()
+    funnel_stages = funnel.get("stages", [])
+    stage_reach = {stage['status']: stage['reached'] for stage in funnel_stages}
+    
     # Summary metrics with custom styling - Enhanced header
     st.markdown("""
     <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
@@ -198,6 +204,23 @@ try:
         </div>
         """.format(success_rate), unsafe_allow_html=True)
     
+    # Response time from the status history (Applied -> first status change)
+    if summary.get("responded_applications"):
+        st.markdown("""
+        <div style='background: #f8fafc; padding: 18px 25px; border-radius: 15px; margin-top: 20px;
+                    border: 1px solid #e5e7eb; text-align: center; font-size: 16px; color: #374151;'>
+            ⏱️ <b>Thời gian phản hồi</b> ({} đơn) &nbsp;·&nbsp;
+            Trung bình: <b>{:.1f} ngày</b> &nbsp;·&nbsp;
+            Trung vị: <b>{:.1f} ngày</b> &nbsp;·&nbsp;
+            P90: <b>{:.1f} ngày</b>
+        </div>
+        """.format(
+            summary["responded_applications"],
+            summary["average_response_time_days"],
+            summary["median_response_time_days"],
+            summary["p90_response_time_days"]
+        ), unsafe_allow_html=True)
+    
     st.markdown("")  # Add spacing
     
     st.markdown("---")
@@ -373,14 +396,13 @@ try:
         timeline_offers = df_timeline['offers'].sum() if 'offers' in df_timeline.columns else 0
         timeline_hired = df_timeline['hired'].sum() if 'hired' in df_timeline.columns else 0
         
-        # Calculate conversion rates using summary data (more accurate)
+        # Conversion rates from the server-side funnel (stage reach counts)
         # Interview rate: jobs that reached interview stage / total jobs
-        jobs_reached_interview = (status_dict.get('Interview', 0) + status_dict.get('Offer', 0) + 
-                                   status_dict.get('Hired', 0) + status_dict.get('Rejected', 0))
+        jobs_reached_interview = stage_reach.get('Interview', 0)
         interview_rate = (jobs_reached_interview / total_apps * 100) if total_apps > 0 else 0
         
         # Offer rate: jobs that got offer / jobs that reached interview
-        jobs_got_offer = status_dict.get('Offer', 0) + status_dict.get('Hired', 0)
+        jobs_got_offer = stage_reach.get('Offer', 0)
         offer_rate = (jobs_got_offer / jobs_reached_interview * 100) if jobs_reached_interview > 0 else 0
         
         # Quick insights above chart (use timeline data for display)
@@ -649,7 +671,8 @@ try:
         }
         
         for idx, (status, col) in enumerate(zip(pipeline_order[:5], pipeline_cols)):
-            count = status_dict.get(status, 0)
+            # Jobs that reached this stage (or a later one)
+            count = stage_reach.get(status, 0)
             percentage = (count / total_applications * 100) if total_applications > 0 else 0
             status_vn = status_vn_map[status]
             color = pipeline_colors[status]
@@ -701,7 +724,7 @@ try:
                     """, unsafe_allow_html=True)
         
         # Rejected box below
-        rejected_count = status_dict.get('Rejected', 0)
+        rejected_count = funnel.get('rejected', 0)
         rejected_pct = (rejected_count / total_applications * 100) if total_applications > 0 else 0
         
         st.markdown("</div>", unsafe_allow_html=True)
@@ -727,6 +750,27 @@ try:
             </div>
             """, unsafe_allow_html=True)
         
+        # Sankey of status changes (from -> to matrix computed by the backend)
+        transitions = funnel.get("transitions", [])
+        if transitions:
+            statuses = {t['from_status'] for t in transitions} | {t['to_status'] for t in transitions}
+            node_names = pipeline_order + sorted(statuses - set(pipeline_order))
+            node_index = {name: i for i, name in enumerate(node_names)}
+            fig_sankey = go.Figure(go.Sankey(
+                node=dict(
+                    label=[status_vn_map.get(name, name) for name in node_names],
+                    pad=20,
+                    thickness=18
+                ),
+                link=dict(
+                    source=[node_index[t['from_status']] for t in transitions],
+                    target=[node_index[t['to_status']] for t in transitions],
+                    value=[t['count'] for t in transitions]
+                )
+            ))
+            fig_sankey.update_layout(height=380, margin=dict(l=10, r=10, t=10, b=10))
+            st.plotly_chart(fig_sankey, use_container_width=True)
+        
         # Create two columns for detailed metrics
         col1, col2 = st.columns([3, 2])
         
@@ -748,16 +792,15 @@ try:
                 'Hired': 'Đã nhận việc'
             }
             
-            # Only calculate conversions for the 5 main pipeline stages (exclude Rejected)
-            main_pipeline = ['Applied', 'Screening', 'Interview', 'Offer', 'Hired']
+            # Stage-to-stage conversion from the funnel (5 main stages, excluding Rejected)
             conversions = []
-            for i in range(len(main_pipeline) - 1):
-                current_stage = main_pipeline[i]
-                next_stage = main_pipeline[i + 1]
-                current_count = status_dict.get(current_stage, 0)
-                next_count = status_dict.get(next_stage, 0)
+            for previous_stage, stage in zip(funnel_stages, funnel_stages[1:]):
+                current_stage = previous_stage['status']
+                next_stage = stage['status']
+                current_count = previous_stage['reached']
+                next_count = stage['reached']
                 
-                rate = (next_count / current_count * 100) if current_count > 0 else 0
+                rate = stage['conversion_rate'] or 0
                 conversions.append({
                     'from': status_vn_map.get(current_stage, current_stage),
                     'to': status_vn_map.get(next_stage, next_stage),
@@ -464,7 +464,7 @@ def load_data():
         stats = {"total": 0, "passed": 0, "failed": 0, "pending": 0, "pass_rate": 0}
     
     try:
-        jobs_response = job_service.get_jobs(page_size=100)
+        jobs_response = job_service.get_jobs(page_size=100, fields=["company_name", "job_title"])
         jobs = jobs_response.get("items", [])
         jobs_map = {j["id"]: j for j in jobs}
     except:
@@ -1,7 +1,7 @@
 """
 Analytics service - API calls for analytics
 """
-from typing import Dict
+from typing import Dict, Optional
 from frontend.services.api_client import APIClient
 
 
@@ -27,9 +27,23 @@ class AnalyticsService:
         """Get statistics by source"""
         return self.client.get("/analytics/by-source")
     
-    def get_timeline(self, period: str = "month") -> Dict:
-        """Get timeline statistics"""
-        return self.client.get("/analytics/timeline", params={"period": period})
+    def get_funnel(self) -> Dict:
+        """Get pipeline funnel (stage reach + transition matrix)"""
+        return self.client.get("/analytics/funnel")
+    
+    def get_timeline(
+        self,
+        period: str = "month",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict:
+        """Get timeline statistics (period: day/week/month/quarter, dates as YYYY-MM-DD)"""
+        params = {"period": period}
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        return self.client.get("/analytics/timeline", params=params)
 
 
 # Create singleton instance
@@ -1,20 +1,36 @@
 """
 Base API client
 """
+import copy
+import threading
+from collections import OrderedDict
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from frontend.config.settings import API_URL
 
+# Responses kept for conditional GET revalidation (shared by all clients)
+VALIDATOR_CACHE_SIZE = 256
+
 
 class APIClient:
     """Base API client for making HTTP requests"""
     
+    # (url, params) -> (ETag, Last-Modified, body); Streamlit reruns send the
+    # validators back and reuse the body on 304 Not Modified
+    _validated: "OrderedDict[Tuple, Tuple[Optional[str], Optional[str], Any]]" = OrderedDict()
+    _validated_lock = threading.Lock()
+    
+    # Cookies set by the API (last_write keeps reads after our own writes on
+    # the primary database); shared like the Streamlit server's one connection
+    _cookies = requests.cookies.RequestsCookieJar()
+    
     def __init__(self, base_url: str = API_URL):
         self.base_url = base_url
         self.timeout = 30
     
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response"""
+        self._cookies.update(response.cookies)
         try:
             response.raise_for_status()
             if response.status_code == 204:
@@ -27,31 +43,65 @@ class APIClient:
             raise Exception(f"Request failed: {str(e)}")
     
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """GET request"""
+        """GET request - conditional when an earlier response carried validators"""
         url = f"{self.base_url}{endpoint}"
-        response = requests.get(url, params=params, timeout=self.timeout)
-        return self._handle_response(response)
+        key = (url, tuple(sorted((params or {}).items())))
+        with self._validated_lock:
+            cached = self._validated.get(key)
+        
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        response = requests.get(url, params=params, headers=headers, cookies=self._cookies, timeout=self.timeout)
+        if response.status_code == 304 and cached is not None:
+            with self._validated_lock:
+                self._validated.move_to_end(key)
+            # Callers may modify what they get back
+            return copy.deepcopy(cached[2])
+        
+        data = self._handle_response(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._validated_lock:
+            if etag or last_modified:
+                self._validated[key] = (etag, last_modified, copy.deepcopy(data))
+                self._validated.move_to_end(key)
+                while len(self._validated) > VALIDATOR_CACHE_SIZE:
+                    self._validated.popitem(last=False)
+            else:
+                self._validated.pop(key, None)
+        return data
     
     def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """POST request"""
         url = f"{self.base_url}{endpoint}"
-        response = requests.post(url, json=data, timeout=self.timeout)
+        response = requests.post(url, json=data, cookies=self._cookies, timeout=self.timeout)
         return self._handle_response(response)
     
     def put(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """PUT request"""
         url = f"{self.base_url}{endpoint}"
-        response = requests.put(url, json=data, timeout=self.timeout)
+        response = requests.put(url, json=data, cookies=self._cookies, timeout=self.timeout)
         return self._handle_response(response)
     
-    def patch(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """PATCH request"""
+    def patch(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """PATCH request (query params and/or JSON body)"""
         url = f"{self.base_url}{endpoint}"
-        response = requests.patch(url, params=params, timeout=self.timeout)
+        response = requests.patch(url, params=params, json=data, cookies=self._cookies, timeout=self.timeout)
         return self._handle_response(response)
     
     def delete(self, endpoint: str) -> Dict[str, Any]:
         """DELETE request"""
         url = f"{self.base_url}{endpoint}"
-        response = requests.delete(url, timeout=self.timeout)
+        response = requests.delete(url, cookies=self._cookies, timeout=self.timeout)
         return self._handle_response(response)
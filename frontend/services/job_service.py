@@ -15,19 +15,37 @@ class JobService:
         """Create a new job"""
         return self.client.post("/jobs/", job_data)
     
+    def bulk_create_jobs(self, jobs: List[Dict]) -> Dict:
+        """Create many jobs in one request - per-item results in request order"""
+        return self.client.post("/jobs/bulk", {"items": jobs})
+    
     def get_jobs(
         self,
         page: int = 1,
         page_size: int = 20,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        cursor: Optional[str] = None,
+        count: Optional[str] = None,
+        fields: Optional[List[str]] = None
     ) -> Dict:
-        """Get jobs with pagination and filters"""
+        """
+        Get jobs with pagination and filters
+        cursor: next_cursor from a previous response (keyset pagination)
+        count: exact (default), estimate or none - none returns total = null
+        fields: columns to return (id is always included); None returns all
+        """
         params = {
             "page": page,
             "page_size": page_size
         }
         if filters:
             params.update(filters)
+        if cursor:
+            params["cursor"] = cursor
+        if count:
+            params["count"] = count
+        if fields:
+            params["fields"] = ",".join(fields)
         
         return self.client.get("/jobs/", params=params)
     
@@ -50,6 +68,13 @@ class JobService:
             params["notes"] = notes
         return self.client.patch(f"/jobs/{job_id}/status", params=params)
     
+    def bulk_update_status(self, changes: List[Dict]) -> Dict:
+        """
+        Move many jobs in one request
+        changes: [{"job_id": ..., "new_status": ..., "notes": ...}]
+        """
+        return self.client.patch("/jobs/bulk-status", data={"items": changes})
+    
     def delete_job(self, job_id: int) -> Dict:
         """Delete job"""
         return self.client.delete(f"/jobs/{job_id}")
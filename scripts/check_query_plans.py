@@ -0,0 +1,135 @@
+"""
+Check that every hot list query is served by an index
+Run after migrating: python scripts/check_query_plans.py
+Exits with status 1 if any query plan falls back to a full scan or a sort
+"""
+import re
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, func
+from backend.core.database import engine
+from backend.core.fulltext import get_fulltext_backend
+from backend.models.interview import Interview
+from backend.schemas.job import JobFilter
+from backend.schemas.interview import InterviewFilter
+from backend.services.job_service import JobService
+from backend.services.interview_service import InterviewService
+from backend.utils.pagination import encode_cursor
+
+# Plan lines that mean "no usable index"
+SQLITE_BAD_PLAN = re.compile(r"^SCAN \w+$|USE TEMP B-TREE FOR ORDER BY")
+POSTGRES_BAD_PLAN = re.compile(r"Seq Scan on|^\s*(->\s*)?Sort\b")
+
+# Search queries sort their (index-selected) matches - only a full scan is bad
+SQLITE_FULL_SCAN = re.compile(r"^SCAN \w+$")
+POSTGRES_FULL_SCAN = re.compile(r"Seq Scan on")
+
+
+def get_hot_queries(dialect_name: str):
+    """(name, statement) pairs for the access paths the API hits on every page load"""
+    now = datetime.now()
+    fulltext = get_fulltext_backend(dialect_name)
+    keyset_filter = JobFilter(cursor=encode_cursor("applied_date", "desc", "2025-01-01", 100))
+    return [
+        ("jobs: default list (applied_date desc)",
+         JobService.build_jobs_query(JobFilter(), dialect_name).limit(20)),
+        # What get_jobs runs by default (count=exact): page + COUNT(*) OVER ()
+        ("jobs: default page with windowed total",
+         JobService.build_page_query(JobFilter(), dialect_name, count_in_query=True)),
+        ("jobs: keyset page with total (scalar subquery)",
+         JobService.build_page_query(keyset_filter, dialect_name, count_in_query=True)),
+        ("jobs: status filter page with windowed total",
+         JobService.build_page_query(JobFilter(status="Interview"), dialect_name, count_in_query=True)),
+        ("jobs: keyset page after cursor",
+         JobService.apply_cursor(
+             JobService.build_jobs_query(keyset_filter, dialect_name), keyset_filter, dialect_name
+         ).limit(20)),
+        ("jobs: status filter + applied_date order",
+         JobService.build_jobs_query(JobFilter(status="Interview"), dialect_name).limit(20)),
+        ("jobs: status count",
+         select(func.count()).select_from(
+             JobService.build_jobs_query(JobFilter(status="Interview"), dialect_name).order_by(None).subquery()
+         )),
+        ("jobs: favorites + applied_date order",
+         JobService.build_jobs_query(JobFilter(is_favorite=True), dialect_name).limit(20)),
+        ("jobs: work_type filter + applied_date order",
+         JobService.build_jobs_query(JobFilter(work_type="Remote"), dialect_name).limit(20)),
+        ("jobs: full-text search ranked by relevance",
+         fulltext.search_query(["python", "ha"], ranked=True).limit(20)),
+        ("interviews: by job ordered by round",
+         select(Interview).where(Interview.job_id == 1).order_by(Interview.round_number.asc())),
+        ("interviews: date range + result",
+         InterviewService.build_interviews_query(InterviewFilter(
+             result="Pending",
+             scheduled_date_from=now - timedelta(days=30),
+             scheduled_date_to=now
+         ))),
+        ("interviews: upcoming",
+         select(Interview)
+         .where(Interview.scheduled_date >= now, Interview.scheduled_date <= now + timedelta(days=7))
+         .order_by(Interview.scheduled_date.asc())),
+    ]
+
+
+def get_search_queries(dialect_name: str):
+    """(name, statement) pairs for search filters - matches are sorted after the lookup"""
+    return [
+        ("jobs: accent-insensitive company/title search",
+         JobService.build_jobs_query(JobFilter(company_name="Hà Nội", job_title="Hà Nội"), dialect_name).limit(20)),
+        ("jobs: accent-insensitive location filter",
+         JobService.build_jobs_query(JobFilter(location="ha noi"), dialect_name).limit(20)),
+    ]
+
+
+def explain(connection, statement) -> list[str]:
+    """Return the plan of a statement as text lines"""
+    compiled = statement.compile(dialect=connection.dialect)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+        return [row[-1] for row in rows]
+    
+    # Make the planner prefer any usable index over a scan on small tables
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    connection.exec_driver_sql("SET LOCAL enable_sort = off")
+    rows = connection.exec_driver_sql(f"EXPLAIN {compiled}", params).all()
+    return [row[0] for row in rows]
+
+
+def main():
+    """Explain each hot query and report plans without an index"""
+    dialect_name = engine.dialect.name
+    bad_plan = SQLITE_BAD_PLAN if dialect_name == "sqlite" else POSTGRES_BAD_PLAN
+    full_scan = SQLITE_FULL_SCAN if dialect_name == "sqlite" else POSTGRES_FULL_SCAN
+    checks = [(name, statement, bad_plan) for name, statement in get_hot_queries(dialect_name)]
+    checks += [(name, statement, full_scan) for name, statement in get_search_queries(dialect_name)]
+    failures = 0
+    
+    with engine.connect() as connection:
+        for name, statement, bad_plan in checks:
+            plan = explain(connection, statement)
+            offending = [line for line in plan if bad_plan.search(line)]
+            if offending:
+                failures += 1
+                print(f"❌ {name}")
+                for line in plan:
+                    print(f"     {line}")
+            else:
+                print(f"✅ {name}")
+    
+    if failures:
+        print(f"\n{failures} hot queries are not fully index-backed")
+        sys.exit(1)
+    print("\nAll hot queries use an index")
+
+
+if __name__ == "__main__":
+    main()
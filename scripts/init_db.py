@@ -1,36 +1,79 @@
 """
 Database initialization script
-Run this to create the database tables
+Run this to create or upgrade the database schema
+
+Usage:
+    python scripts/init_db.py migrate   # apply Alembic migrations (default)
+    python scripts/init_db.py version   # show database and code revisions
+    python scripts/init_db.py rebuild-rollups   # recompute analytics rollup tables
 """
 import sys
+import asyncio
 from pathlib import Path
 
 # Add backend to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from backend.core.database import init_db, engine
-from backend.models.job import Job
-from backend.models.application import Application
-from backend.models.interview import Interview
-from backend.models.note import Note
-from backend.models.email_template import EmailTemplate
+from backend.core.database import engine, async_engine
+from backend.core.schema import migrate, get_head_revision, get_database_revision
+from backend.models.rollup import rebuild_rollups
+
+
+def run_migrate():
+    """Upgrade the database to the latest migration"""
+    print("Migrating database...")
+    revision = migrate(engine)
+    print(f"✅ Database migrated to revision {revision}")
+    print(f"📍 Database location: {engine.url}")
+
+    # Print created tables
+    from sqlalchemy import inspect
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+    print(f"\n📋 Tables: {', '.join(tables)}")
+
+
+def run_version():
+    """Print database revision vs code head"""
+    async def read_revision():
+        try:
+            return await get_database_revision(async_engine)
+        finally:
+            await async_engine.dispose()
+
+    current = asyncio.run(read_revision())
+    head = get_head_revision()
+    print(f"📍 Database revision: {current or 'none'}")
+    print(f"📦 Code head revision: {head}")
+    if current != head:
+        print("⚠️  Database is out of date - run: python scripts/init_db.py migrate")
+        sys.exit(1)
+
+
+def run_rebuild_rollups():
+    """Recompute the analytics rollup tables from jobs/interviews"""
+    print("Rebuilding analytics rollups...")
+    with engine.begin() as connection:
+        rebuild_rollups(connection)
+    print("✅ Analytics rollups rebuilt")
+
+
+COMMANDS = {
+    "migrate": run_migrate,
+    "version": run_version,
+    "rebuild-rollups": run_rebuild_rollups,
+}
 
 
 def main():
     """Initialize database"""
-    print("Initializing database...")
-    
+    command = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if command not in COMMANDS:
+        print(f"❌ Unknown command '{command}'. Available: {', '.join(COMMANDS)}")
+        sys.exit(2)
+
     try:
-        init_db()
-        print("✅ Database initialized successfully!")
-        print(f"📍 Database location: {engine.url}")
-        
-        # Print created tables
-        from sqlalchemy import inspect
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
-        print(f"\n📋 Created tables: {', '.join(tables)}")
-        
+        COMMANDS[command]()
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
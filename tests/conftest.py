@@ -0,0 +1,64 @@
+"""
+Shared fixtures - the API against a migrated, seeded temporary SQLite database
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Point the app at a throwaway database before anything imports its settings
+DB_DIR = tempfile.mkdtemp(prefix="job_tracker_tests_")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_DIR}/test.db"
+os.environ["DEBUG"] = "False"
+
+# Add the project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+import backend.models  # noqa: F401 - registers every model and session hook
+from backend.core.database import engine
+from backend.core.schema import migrate
+from backend.models.rollup import rebuild_rollups
+
+ROLLUP_TABLES = (
+    "job_status_counts",
+    "job_source_status_counts",
+    "job_month_status_counts",
+    "interview_month_counts",
+)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient over the seeded database"""
+    from scripts.seed_db import main as seed
+    from backend.main import app
+    
+    migrate(engine)
+    seed()
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def rollup_rows(connection) -> dict:
+    """Non-zero rows of every rollup table (a rebuild drops zero counts)"""
+    return {
+        table: sorted(row for row in connection.execute(text(f"SELECT * FROM {table}")).all() if row[-1])
+        for table in ROLLUP_TABLES
+    }
+
+
+@pytest.fixture
+def assert_rollups_match_rebuild():
+    """Check that the incrementally maintained rollups equal a full rebuild"""
+    def check():
+        with engine.connect() as connection:
+            incremental = rollup_rows(connection)
+            rebuild_rollups(connection)
+            rebuilt = rollup_rows(connection)
+            connection.rollback()
+        assert incremental == rebuilt
+    return check
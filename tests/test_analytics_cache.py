@@ -0,0 +1,61 @@
+"""
+Versioned analytics cache - invalidation by writes and where misses are read
+"""
+import asyncio
+
+from backend.core.cache import VersionedCache
+from backend.core.database import AsyncReadSessionLocal, engine
+from backend.core.routing import primary_reads
+
+
+def test_write_invalidates_cached_analytics(client):
+    before = client.get("/api/v1/analytics/summary")
+    assert before.status_code == 200
+    etag = before.headers["etag"]
+    
+    response = client.post("/api/v1/jobs/", json={
+        "company_name": "Cache Co", "job_title": "Analyst", "applied_date": "2026-04-01"
+    })
+    assert response.status_code == 201
+    
+    after = client.get("/api/v1/analytics/summary", headers={"If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.json()["total_applications"] == before.json()["total_applications"] + 1
+
+
+def test_cache_fills_read_from_the_primary():
+    cache = VersionedCache(fill_context=primary_reads)
+    read_engines = []
+    
+    @cache.cached
+    async def compute(db):
+        read_engines.append(db.info.get("read_engine"))
+        return len(read_engines)
+    
+    async def run():
+        # A replica-routed session, as get_read_db opens for a lagging replica
+        async with AsyncReadSessionLocal(info={"read_engine": engine}) as db:
+            values = [await compute(db), await compute(db)]
+            return values, db.info.get("read_engine")
+    
+    values, read_engine = asyncio.run(run())
+    assert values == [1, 1]
+    assert read_engines == [None]
+    assert read_engine is engine
+
+
+def test_value_computed_across_a_write_is_not_stored():
+    cache = VersionedCache()
+    
+    @cache.cached
+    async def compute(db):
+        cache.bump_version()
+        return "stale"
+    
+    asyncio.run(compute(None))
+    assert cache.snapshot()["entries"] == 0
+
+
+def test_zero_ttl_has_no_validator():
+    assert VersionedCache(ttl=0).validator() is None
+    assert VersionedCache(ttl=60).validator() is not None
@@ -0,0 +1,73 @@
+"""
+Bulk job endpoints: history rows, cache invalidation and rollup upkeep
+"""
+from sqlalchemy import select, func
+
+from backend.core.database import engine
+from backend.models.application import Application
+from backend.services.analytics_service import analytics_cache
+
+
+def history_count(job_ids, **filters) -> int:
+    """Application history rows of the given jobs"""
+    query = select(func.count()).select_from(Application).where(Application.job_id.in_(job_ids))
+    for name, value in filters.items():
+        query = query.where(getattr(Application, name) == value)
+    with engine.connect() as connection:
+        return connection.scalar(query)
+
+
+def bulk_create(client, count: int, **fields) -> list:
+    """Create jobs through POST /jobs/bulk and return their ids"""
+    items = [
+        {"company_name": f"Bulk {i}", "job_title": "Developer", "applied_date": f"2026-03-0{i % 9 + 1}",
+         "source": "LinkedIn", **fields}
+        for i in range(count)
+    ]
+    response = client.post("/api/v1/jobs/bulk", json={"items": items})
+    assert response.status_code == 201
+    body = response.json()
+    assert body["succeeded"] == count
+    return [result["job_id"] for result in body["results"]]
+
+
+def test_bulk_create_writes_history_and_bumps_cache(client):
+    version = analytics_cache.version
+    job_ids = bulk_create(client, 5)
+    
+    assert analytics_cache.version > version
+    assert history_count(job_ids, status="Applied") == 5
+    for job_id in job_ids:
+        assert client.get(f"/api/v1/jobs/{job_id}").json()["current_status"] == "Applied"
+
+
+def test_bulk_status_writes_history_and_bumps_cache(client):
+    job_ids = bulk_create(client, 3)
+    version = analytics_cache.version
+    
+    items = [{"job_id": job_id, "new_status": "Screening", "notes": "bulk triage"} for job_id in job_ids]
+    items.append({"job_id": 999999, "new_status": "Screening"})
+    response = client.patch("/api/v1/jobs/bulk-status", json={"items": items})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (3, 1)
+    assert body["results"][-1]["status"] == "not_found"
+    
+    assert analytics_cache.version > version
+    assert history_count(job_ids, status="Screening", notes="bulk triage") == 3
+
+
+def test_bulk_create_rejects_invalid_batch(client):
+    version = analytics_cache.version
+    response = client.post("/api/v1/jobs/bulk", json={"items": [{"company_name": ""}]})
+    assert response.status_code == 422
+    assert analytics_cache.version == version
+
+
+def test_rollups_match_rebuild_after_bulk_writes(client, assert_rollups_match_rebuild):
+    job_ids = bulk_create(client, 4)
+    assert_rollups_match_rebuild()
+    
+    items = [{"job_id": job_id, "new_status": "Rejected"} for job_id in job_ids[:2]]
+    assert client.patch("/api/v1/jobs/bulk-status", json={"items": items}).status_code == 200
+    assert_rollups_match_rebuild()
@@ -0,0 +1,92 @@
+"""
+Conditional GET - ETags, 304 Not Modified and revalidation after writes
+"""
+import pytest
+
+
+@pytest.mark.parametrize("url", [
+    "/api/v1/jobs/",
+    "/api/v1/jobs/?status=Applied&page_size=5",
+    "/api/v1/jobs/1",
+    "/api/v1/interviews/1",
+])
+def test_matching_if_none_match_returns_304(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    
+    assert client.get(url, headers={"If-None-Match": 'W/"stale"'}).status_code == 200
+
+
+def revalidate(client, url: str, etag: str):
+    """Conditional GET that must not be answered 304 - returns the new body"""
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    return response.json()
+
+
+@pytest.fixture
+def job_id(client):
+    """A fresh job, so writes in the same second as its creation are covered"""
+    response = client.post("/api/v1/jobs/", json={
+        "company_name": "ETag Co", "job_title": "Engineer", "applied_date": "2026-02-02"
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_put_changes_the_job_etag(client, job_id):
+    url = f"/api/v1/jobs/{job_id}"
+    etag = client.get(url).headers["etag"]
+    
+    # Same second as the GET - updated_at alone could not tell the versions apart
+    assert client.put(url, json={"location": "Đà Nẵng"}).status_code == 200
+    assert revalidate(client, url, etag)["location"] == "Đà Nẵng"
+    
+    etag = client.get(url).headers["etag"]
+    assert client.put(url, json={"location": "Huế"}).status_code == 200
+    assert revalidate(client, url, etag)["location"] == "Huế"
+
+
+def test_write_to_any_row_changes_the_list_etag(client, job_id):
+    url = "/api/v1/jobs/?sort_by=id&sort_order=desc&page_size=5"
+    listed = client.get(url)
+    etag = listed.headers["etag"]
+    # Not the newest row on the page
+    other_id = listed.json()["items"][1]["id"]
+    
+    assert client.put(f"/api/v1/jobs/{other_id}", json={"job_title": "Staff Engineer"}).status_code == 200
+    items = revalidate(client, url, etag)["items"]
+    assert {item["id"]: item["job_title"] for item in items}[other_id] == "Staff Engineer"
+
+
+def test_bulk_status_changes_the_etags(client, job_id):
+    detail_url = f"/api/v1/jobs/{job_id}"
+    list_url = "/api/v1/jobs/?sort_by=id&sort_order=desc&page_size=5"
+    detail_etag = client.get(detail_url).headers["etag"]
+    list_etag = client.get(list_url).headers["etag"]
+    
+    response = client.patch("/api/v1/jobs/bulk-status", json={"items": [{"job_id": job_id, "new_status": "Screening"}]})
+    assert response.status_code == 200
+    
+    assert revalidate(client, detail_url, detail_etag)["current_status"] == "Screening"
+    items = revalidate(client, list_url, list_etag)["items"]
+    assert {item["id"]: item["current_status"] for item in items}[job_id] == "Screening"
+
+
+def test_put_changes_the_interview_etag(client, job_id):
+    created = client.post("/api/v1/interviews/", json={
+        "job_id": job_id, "round_number": 1, "scheduled_date": "2026-02-10T09:00:00"
+    })
+    assert created.status_code == 201
+    url = f"/api/v1/interviews/{created.json()['id']}"
+    etag = client.get(url).headers["etag"]
+    
+    assert client.put(url, json={"location": "Online"}).status_code == 200
+    assert revalidate(client, url, etag)["location"] == "Online"
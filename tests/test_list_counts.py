@@ -0,0 +1,68 @@
+"""
+List totals - counted in the page statement, estimated or skipped
+"""
+import pytest
+from sqlalchemy import event
+
+from backend.core.database import async_engine, read_engines
+
+
+@pytest.fixture
+def statements():
+    """SQL statements run while the test executes, on every engine the API reads from"""
+    seen = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+    
+    engines = [async_engine.sync_engine, *[replica.sync_engine for replica in read_engines]]
+    for sync_engine in engines:
+        event.listen(sync_engine, "before_cursor_execute", record)
+    yield seen
+    for sync_engine in engines:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+
+def test_exact_total_comes_from_the_page_statement(client, statements):
+    response = client.get("/api/v1/jobs/", params={"page_size": 5})
+    assert response.status_code == 200
+    body = response.json()
+    assert len(statements) == 1
+    
+    everything = client.get("/api/v1/jobs/", params={"page_size": 100, "count": "none"}).json()
+    assert body["total"] == len(everything["items"])
+    assert body["total_pages"] == -(-body["total"] // 5)
+
+
+def test_count_modes(client):
+    exact = client.get("/api/v1/jobs/", params={"status": "Applied"}).json()
+    # SQLite has no planner estimates - estimate falls back to the exact count
+    estimate = client.get("/api/v1/jobs/", params={"status": "Applied", "count": "estimate"}).json()
+    none = client.get("/api/v1/jobs/", params={"status": "Applied", "count": "none"}).json()
+    
+    assert estimate["total"] == exact["total"]
+    assert none["total"] is None
+    assert none["total_pages"] is None
+    assert [job["id"] for job in none["items"]] == [job["id"] for job in exact["items"]]
+
+
+def test_cursor_page_counts_the_whole_filtered_set(client):
+    first = client.get("/api/v1/jobs/", params={"page_size": 3}).json()
+    second = client.get("/api/v1/jobs/", params={"page_size": 3, "cursor": first["next_cursor"]}).json()
+    assert second["total"] == first["total"]
+
+
+def test_page_past_the_end_keeps_the_total(client):
+    total = client.get("/api/v1/jobs/").json()["total"]
+    past_end = client.get("/api/v1/jobs/", params={"page": total + 1, "page_size": 1}).json()
+    assert past_end["items"] == []
+    assert past_end["total"] == total
+
+
+def test_interview_total_is_the_row_count(client, statements):
+    response = client.get("/api/v1/interviews/", params={"result": "Pending"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == len(body["items"])
+    assert len(statements) == 1
+    assert "OVER" not in statements[0]
@@ -0,0 +1,58 @@
+"""
+Incrementally maintained analytics rollups - must always equal a rebuild
+"""
+from sqlalchemy import select
+
+from backend.core.database import engine
+from backend.models.rollup import InterviewMonthCount
+
+
+def interview_month_count(month: str) -> int:
+    """Interviews counted in one month of the rollup"""
+    with engine.connect() as connection:
+        count = connection.scalar(select(InterviewMonthCount.count).where(InterviewMonthCount.month == month))
+    return count or 0
+
+
+def test_rollups_match_rebuild_after_writes(client, assert_rollups_match_rebuild):
+    assert_rollups_match_rebuild()
+    
+    created = client.post("/api/v1/jobs/", json={
+        "company_name": "Rollup Co", "job_title": "Engineer", "applied_date": "2026-01-31", "source": "Referral"
+    })
+    assert created.status_code == 201
+    job_id = created.json()["id"]
+    assert_rollups_match_rebuild()
+    
+    assert client.put(f"/api/v1/jobs/{job_id}", json={"applied_date": "2026-02-01", "source": "LinkedIn"}).status_code == 200
+    assert_rollups_match_rebuild()
+    
+    assert client.patch(f"/api/v1/jobs/{job_id}/status", params={"new_status": "Interview"}).status_code == 200
+    assert_rollups_match_rebuild()
+    
+    assert client.delete(f"/api/v1/jobs/{job_id}").status_code == 204
+    assert_rollups_match_rebuild()
+
+
+def test_interview_months_are_bucketed_in_utc(client, assert_rollups_match_rebuild):
+    february = interview_month_count("2026-02")
+    
+    # 23:30 on Jan 31 at UTC-7 is already February in UTC
+    created = client.post("/api/v1/interviews/", json={
+        "job_id": 1, "round_number": 7, "scheduled_date": "2026-01-31T23:30:00-07:00"
+    })
+    assert created.status_code == 201
+    interview_id = created.json()["id"]
+    assert created.json()["scheduled_date"].startswith("2026-02-01T06:30")
+    assert interview_month_count("2026-02") == february + 1
+    assert_rollups_match_rebuild()
+    
+    # 01:00 on Mar 1 at UTC+9 is still February in UTC
+    updated = client.put(f"/api/v1/interviews/{interview_id}", json={"scheduled_date": "2026-03-01T01:00:00+09:00"})
+    assert updated.status_code == 200
+    assert interview_month_count("2026-02") == february + 1
+    assert_rollups_match_rebuild()
+    
+    assert client.delete(f"/api/v1/interviews/{interview_id}").status_code == 204
+    assert interview_month_count("2026-02") == february
+    assert_rollups_match_rebuild()